@@ -29,6 +29,8 @@ class LabelManager:
         groups: Dictionary mapping group names to lists of labels
         group: Currently active group name
         idx: Index of currently selected label in active group
+        version: Counter bumped on every saved change, so views can tell
+            whether their copy of the labels is stale
     """
     
     STORAGE_DIR = 'states'
@@ -39,6 +41,7 @@ class LabelManager:
         self.groups: Dict[str, List[dict]] = {}
         self.group: str = "Default"
         self.idx: int = 0
+        self.version: int = 0
         self._load_from_storage()
 
     def _load_from_storage(self) -> None:
@@ -67,7 +70,12 @@ class LabelManager:
         
         Creates the storage directory if it doesn't exist and writes
         the current label state to a JSON file.
+        
+        Every change to groups or labels ends up here (directly or via
+        save()), so this is also where the version counter is bumped.
         """
+        self.version += 1
+        
         try:
             os.makedirs(self.STORAGE_DIR, exist_ok=True)
             
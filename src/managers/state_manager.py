@@ -9,7 +9,7 @@ This module handles saving and loading timer states, including:
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 
 class StateManager:
@@ -171,6 +171,15 @@ class StateManager:
             print(f"❌ Error listing save states: {e}")
             return []
     
+    def list_save_states_with_metadata(self) -> List[Tuple[str, Optional[Dict]]]:
+        """Get all save states together with their metadata in one call.
+        
+        Returns:
+            List of (name, metadata) tuples in list_save_states order;
+            metadata is None for saves that could not be read
+        """
+        return [(name, self.get_save_metadata(name)) for name in self.list_save_states()]
+    
     def get_save_metadata(self, name: str) -> Optional[Dict]:
         """Get metadata for a save state without loading full data.
         
@@ -25,7 +25,8 @@ from constants import (ACCENT, DANGER, ICON_ARROW_LEFT, ICON_FOLDER_PLUS,
                       ICON_FONT, ICON_PEN, ICON_PLUS, ICON_TAGS, ICON_TRASH,
                       MUTED, PRIMARY, SURFACE_LIGHT, TEXT)
 from widgets import RButton, create_info_dialog, create_two_button_dialog, create_confirmation_dialog
-from utils import rh, rfs, rp, rs, ResponsiveSize
+from utils import (rh, rfs, rp, rs, ResponsiveSize, size_to_text_size,
+                   track_icon_label)
 
 
 def create_safe_color_picker():
@@ -92,6 +93,7 @@ class LabelsScreen(Screen):
             font_name=ICON_FONT,
             font_size=rfs('icon')
         )
+        track_icon_label(back_btn)
         back_btn.bind(on_press=self._navigate_back)
         
         # Title
@@ -150,6 +152,7 @@ class LabelsScreen(Screen):
             font_name=ICON_FONT,
             font_size="14sp"
         )
+        track_icon_label(edit_group_btn)
         edit_group_btn.bind(on_press=self._open_edit_group_popup)
         
         separator2 = self._create_separator()
@@ -162,6 +165,7 @@ class LabelsScreen(Screen):
             font_name=ICON_FONT,
             font_size="15sp"
         )
+        track_icon_label(add_group_btn)
         add_group_btn.bind(on_press=self._open_add_group_popup)
         
         group_controls.add_widget(self.group_spinner)
@@ -213,6 +217,7 @@ class LabelsScreen(Screen):
             font_name=ICON_FONT,
             font_size=f"{button_size * 0.1}sp"
         )
+        track_icon_label(plus_btn)
         plus_btn.bind(on_press=self._open_add_label_popup)
         
         container = BoxLayout(
@@ -265,7 +270,7 @@ class LabelsScreen(Screen):
             halign="left",
             valign="middle"
         )
-        name_label.bind(size=name_label.setter('text_size'))
+        name_label.bind(size=size_to_text_size)
         
         desc_label = Label(
             text=label.get("desc", ""),
@@ -275,7 +280,7 @@ class LabelsScreen(Screen):
             halign="left",
             valign="middle"
         )
-        desc_label.bind(size=desc_label.setter('text_size'))
+        desc_label.bind(size=size_to_text_size)
         
         if not label.get("is_default", False):
             edit_btn = RButton(
@@ -286,6 +291,7 @@ class LabelsScreen(Screen):
                 font_name=ICON_FONT,
                 font_size="15sp"
             )
+            track_icon_label(edit_btn)
             edit_btn.bind(on_press=lambda _, i=index: self._open_edit_label_popup(i))
         else:
             edit_btn = Widget(size_hint_x=None, width=rh('button'))
@@ -299,6 +305,7 @@ class LabelsScreen(Screen):
                 font_name=ICON_FONT,
                 font_size="15sp"
             )
+            track_icon_label(del_btn)
             del_btn.bind(on_press=lambda _, i=index: self._delete_label(i))
         else:
             del_btn = Widget(size_hint_x=None, width=rh('button'))
@@ -373,7 +380,7 @@ class LabelsScreen(Screen):
             halign="left",
             valign="middle"
         )
-        checkbox_label.bind(size=checkbox_label.setter('text_size'))
+        checkbox_label.bind(size=size_to_text_size)
         checkbox_container.add_widget(auto_check)
         checkbox_container.add_widget(checkbox_label)
         content.add_widget(checkbox_container)
@@ -494,7 +501,7 @@ class LabelsScreen(Screen):
             halign="left",
             valign="middle"
         )
-        checkbox_label.bind(size=checkbox_label.setter('text_size'))
+        checkbox_label.bind(size=size_to_text_size)
         checkbox_container.add_widget(auto_check)
         checkbox_container.add_widget(checkbox_label)
         content.add_widget(checkbox_container)
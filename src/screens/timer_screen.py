@@ -4,7 +4,7 @@ Main optimization: Only add new lap rows instead of rebuilding all rows.
 This makes adding laps MUCH faster, especially with many existing laps.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
@@ -19,7 +19,8 @@ from kivy.clock import Clock
 from constants import (ACCENT, DANGER, ICON_BARS, ICON_FONT, ICON_PEN,
                       ICON_PLAY, ICON_STOP, ICON_TAGS, MUTED, SURFACE_LIGHT, TEXT)
 from widgets import RButton, LabelSpinner, SlideMenu
-from utils import format_time, CSVExporter, rh, rfs, rp, rs
+from utils import (format_time, CSVExporter, rh, rfs, rp, rs, size_to_text_size,
+                   track_icon_label)
 from managers import StateManager
 
 
@@ -68,6 +69,9 @@ class TimerScreen(Screen):
         # Performance optimization: track lap widgets
         self.lap_widgets: List[BoxLayout] = []
         
+        # Save state menu, built on first open and reused afterwards
+        self._save_menu: Optional[SlideMenu] = None
+        
         self._build_ui()
         self._load_from_storage()
 
@@ -114,6 +118,7 @@ class TimerScreen(Screen):
             font_name=ICON_FONT,
             font_size=rfs('icon')
         )
+        track_icon_label(burger_btn)
         burger_btn.bind(on_press=self._open_save_menu)
         
         # Title
@@ -125,7 +130,7 @@ class TimerScreen(Screen):
             color=TEXT,
             font_size=rfs('title')
         )
-        title.bind(size=title.setter('text_size'))
+        title.bind(size=size_to_text_size)
         
         # Labels/tags button
         labels_btn = RButton(
@@ -136,6 +141,7 @@ class TimerScreen(Screen):
             font_name=ICON_FONT,
             font_size=rfs('icon')
         )
+        track_icon_label(labels_btn)
         labels_btn.bind(on_press=self._navigate_to_labels)
         
         header.add_widget(burger_btn)
@@ -196,7 +202,7 @@ class TimerScreen(Screen):
             valign="bottom",
             font_size="12sp"
         )
-        label_text.bind(size=label_text.setter('text_size'))
+        label_text.bind(size=size_to_text_size)
         
         # Create temporary lap dict for spinner
         temp_label = self.lm.current().copy()
@@ -436,7 +442,7 @@ class TimerScreen(Screen):
             halign="left",
             valign="center"
         )
-        num_label.bind(size=num_label.setter('text_size'))
+        num_label.bind(size=size_to_text_size)
 
         # Start/Stop indicator
         lap_type = lap.get("type")
@@ -451,7 +457,8 @@ class TimerScreen(Screen):
                 halign="center",
                 valign="middle"
             )
-            indicator.bind(size=indicator.setter('text_size'))
+            track_icon_label(indicator)
+            indicator.bind(size=size_to_text_size)
         else:
             indicator = Widget(size_hint_x=None, width=rp() * 2.5)
         
@@ -480,6 +487,7 @@ class TimerScreen(Screen):
             font_name=ICON_FONT,
             font_size="15sp"
         )
+        track_icon_label(pencil_btn)
         pencil_btn.bind(on_press=lambda *_, l=lap: self._open_note_popup(l, 
                                                                          pencil_btn))
         
@@ -661,9 +669,14 @@ class TimerScreen(Screen):
         self.manager.current = "labels"
 
     def _open_save_menu(self, *args) -> None:
-        """Open the slide-in save state menu."""
-        menu = SlideMenu(timer_screen=self)
-        menu.open()
+        """Open the slide-in save state menu.
+        
+        The menu is kept between opens, so its rows are only updated for
+        save states that changed instead of being rebuilt every time.
+        """
+        if self._save_menu is None:
+            self._save_menu = SlideMenu(timer_screen=self)
+        self._save_menu.open()
 
     # ==========================================================================
     # STATE PERSISTENCE
@@ -769,6 +782,10 @@ class TimerScreen(Screen):
         """Get metadata for a save state."""
         return self.state_manager.get_save_metadata(state_name)
 
+    def _get_all_save_states_with_metadata(self) -> List[Tuple[str, Optional[Dict]]]:
+        """Get all save states paired with their metadata."""
+        return self.state_manager.list_save_states_with_metadata()
+
     # ==========================================================================
     # CSV EXPORT
     # ==========================================================================
@@ -4,17 +4,21 @@ Exports commonly used utility functions and classes.
 """
 
 from .formatting import format_time
-from .font_loader import download_font_awesome
+from .font_loader import download_font_awesome, track_icon_label
 from .export import CSVExporter
-from .responsive import ResponsiveSize, rh, rfs, rp, rs
+from .responsive import ResponsiveSize, Size, rh, rfs, rp, rs
+from .ui_helpers import size_to_text_size
 
 __all__ = [
     'format_time',
     'download_font_awesome',
+    'track_icon_label',
     'CSVExporter',
     'ResponsiveSize',
+    'Size',
     'rh',
     'rfs', 
     'rp',
-    'rs'
+    'rs',
+    'size_to_text_size'
 ]
\ No newline at end of file
@@ -1,71 +1,102 @@
 """CSV export - FIXED: Wait for permissions before showing dialog."""
 
 import os
-import csv
-from datetime import datetime
+import logging
 from typing import List, Dict, Optional
-from kivy.utils import platform
-from kivy.clock import Clock
 
 from .formatting import format_time
 
 
+log = logging.getLogger(__name__)
+
+_LABEL_INFO_HEADER = (
+    '# Used Labels:',
+    '#     Name,Description,SpecialType',
+)
+"""tuple: Fixed opening lines of the label information section."""
+
+_COLUMN_HEADER = 'Lap,Time,Label,SpecialType,Note'
+"""str: Column header line for the lap data."""
+
+_EMPTY_LAPS_BODY = _LABEL_INFO_HEADER + ('', _COLUMN_HEADER)
+"""tuple: Everything after the metadata header when a save state has no laps."""
+
+
+def _csv_field(value) -> str:
+    """Quote a single CSV field the way csv.writer's default dialect does.
+    
+    Only free-text fields (names, descriptions, notes) need to go through
+    this; numbers and formatted times are written as-is.
+    """
+    if value is None:
+        return ''
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
 class CSVExporter:
     """Handles CSV export with proper permission waiting."""
     
+    _platform: Optional[str] = None
+    """Kivy platform name, resolved on first use and shared by all instances."""
+    
     def __init__(self):
         """Initialize the CSV exporter."""
         self.exports_dir = 'exports'
-        if platform not in ('android', 'ios'):
+        if self._get_platform() not in ('android', 'ios'):
             os.makedirs(self.exports_dir, exist_ok=True)
         
         self.last_error = None
+        self._cached_authority = None
+    
+    @classmethod
+    def _get_platform(cls) -> str:
+        """Return the Kivy platform name, importing kivy.utils only once."""
+        if cls._platform is None:
+            from kivy.utils import platform
+            cls._platform = platform
+        return cls._platform
     
     def export_save_state(self, state_name: str, save_data: dict,
                          success_callback: Optional[callable] = None,
                          error_callback: Optional[callable] = None) -> bool:
         """Export a save state to CSV file."""
-        print(f"\n{'='*60}")
-        print(f"🚀 EXPORT STARTED: {state_name}")
-        print(f"{'='*60}")
+        log.debug("Export started: %s", state_name)
         
         try:
             laps = save_data.get('laps', [])
             saved_at = save_data.get('saved_at', '')
             total_time = save_data.get('time', 0)
             
-            print(f"📊 Data: {len(laps)} laps, {total_time:.2f}s total")
+            log.debug("Data: %d laps, %.2fs total", len(laps), total_time)
             
             # Generate filename with timestamp
             timestamp = self._format_timestamp(saved_at)
             csv_filename = f'{state_name}_{timestamp}.csv'
             
-            print(f"📝 Filename: {csv_filename}")
+            log.debug("Filename: %s", csv_filename)
             
-            # Build CSV content
-            print(f"🔨 Building CSV content...")
+            # Build CSV content (serialized once, reused by every write attempt)
             csv_content = self._build_csv_content(
                 state_name, saved_at, total_time, laps
             )
-            print(f"✅ CSV content built: {len(csv_content)} rows")
+            log.debug("CSV content built: %d bytes", len(csv_content))
             
             # Export using platform-specific method
-            print(f"📱 Platform: {platform}")
+            log.debug("Platform: %s", self._get_platform())
             result = self._export_platform_specific(
                 csv_filename, csv_content, success_callback, error_callback
             )
             
-            print(f"{'='*60}")
-            print(f"{'✅ SUCCESS' if result else '❌ FAILED'}")
-            print(f"{'='*60}\n")
+            log.debug("Export %s", "succeeded" if result else "failed")
             
             return result
             
         except Exception as e:
             error_msg = f"Export error: {str(e)}"
-            print(f"❌ EXCEPTION: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            log.exception(error_msg)
             
             self.last_error = error_msg
             
@@ -75,96 +106,148 @@ class CSVExporter:
             return False
     
     def _build_csv_content(self, state_name: str, saved_at: str,
-                          total_time: float, laps: List[dict]) -> List[List[str]]:
-        """Build the complete CSV content structure."""
-        csv_content = []
+                          total_time: float, laps: List[dict]) -> bytes:
+        """Build the complete CSV file as UTF-8 bytes.
+        
+        Lines are joined with CSV line endings and encoded once here, so
+        retrying the write in another directory doesn't serialize again.
+        """
+        lines = self._build_csv_lines(state_name, saved_at, total_time, laps)
+        return ('\r\n'.join(lines) + '\r\n').encode('utf-8')
+    
+    def _build_csv_lines(self, state_name: str, saved_at: str,
+                         total_time: float, laps: List[dict]) -> List[str]:
+        """Build the complete CSV content as a list of formatted lines.
         
+        Fields are joined directly rather than through csv.writer; only
+        free-text fields are quoted, via _csv_field.
+        """
         # Header with metadata
-        csv_content.extend([
-            ['# Save State Export'],
-            ['# Name:', state_name],
-            ['# Created:', saved_at],
-            ['# Total Time:', format_time(total_time)],
-            ['# Total Laps:', len(laps)],
-            []
-        ])
+        csv_content = [
+            '# Save State Export',
+            f'# Name:,{_csv_field(state_name)}',
+            f'# Created:,{_csv_field(saved_at)}',
+            f'# Total Time:,{format_time(total_time)}',
+            f'# Total Laps:,{len(laps)}',
+            ''
+        ]
+        
+        # Nothing to collect or format for an empty session
+        if not laps:
+            csv_content.extend(_EMPTY_LAPS_BODY)
+            return csv_content
+        
+        # Split laps into per-field columns once (oldest first) so the
+        # label section and the rows don't repeat the dict lookups
+        ordered = laps[::-1]
+        labels = [lap['lbl'] for lap in ordered]
+        names = [label['name'] for label in labels]
+        times = [format_time(lap['t']) for lap in ordered]
+        types = [lap.get('type', '') for lap in ordered]
+        notes = [lap.get('note', '') for lap in ordered]
         
         # Label information
-        csv_content.extend(self._build_label_info(laps))
-        csv_content.append([])
+        csv_content.extend(self._build_label_info(labels, names))
+        csv_content.append('')
         
         # Column headers
-        csv_content.append(['Lap', 'Time', 'Label', 'SpecialType', 'Note'])
+        csv_content.append(_COLUMN_HEADER)
         
         # Lap data (oldest first)
-        for i, lap in enumerate(reversed(laps)):
-            lap_number = i + 1
-            time_str = format_time(lap['t'])
-            label_name = lap['lbl']['name']
-            lap_type = lap.get('type', '')
-            note = lap.get('note', '')
-            
-            csv_content.append([lap_number, time_str, label_name, lap_type, note])
+        csv_content.extend(self._build_lap_rows(times, names, types, notes))
         
         return csv_content
     
-    def _build_label_info(self, laps: List[dict]) -> List[List[str]]:
-        """Build label information section for CSV header."""
-        rows = [
-            ['# Used Labels:'],
-            ['#     Name', 'Description', 'SpecialType']
+    def _build_lap_rows(self, times: List[str], names: List[str],
+                        types: List[Optional[str]], notes: List[str]) -> List[str]:
+        """Build one CSV line per lap from parallel field columns.
+        
+        Laps are numbered in the given order. All lines are assembled in
+        a single list comprehension over the zipped columns.
+        """
+        quote = _csv_field
+        return [
+            f"{lap_number},{time_str},{quote(name)},{lap_type or ''},{quote(note)}"
+            for lap_number, time_str, name, lap_type, note
+            in zip(range(1, len(times) + 1), times, names, types, notes)
         ]
+    
+    def _build_label_info(self, labels: List[dict], names: List[str]) -> List[str]:
+        """Build label information section for CSV header.
         
-        labels_by_group = self._collect_labels_by_group(laps)
+        These are comment rows; only the name and description can contain
+        characters that need quoting.
+        """
+        rows = list(_LABEL_INFO_HEADER)
         
-        for group_name, labels in sorted(labels_by_group.items()):
-            rows.append([f'#   Group: {group_name}'])
-            for label_name, label_info in sorted(labels.items()):
+        labels_by_group = self._collect_labels_by_group(labels, names)
+        
+        for group_name, group_labels in sorted(labels_by_group.items()):
+            rows.append(_csv_field(f'#   Group: {group_name}'))
+            for label_name, label_info in sorted(group_labels.items()):
                 auto_str = "Start/Stop" if label_info['auto_startstop'] else ""
                 desc_str = label_info['desc'] if label_info['desc'] else ""
-                rows.append([
-                    '#     ' + str(label_name),
-                    desc_str,
-                    auto_str
-                ])
+                rows.append(
+                    f"{_csv_field('#     ' + str(label_name))},"
+                    f"{_csv_field(desc_str)},{auto_str}"
+                )
         
         return rows
     
-    def _collect_labels_by_group(self, laps: List[dict]) -> Dict[str, Dict]:
-        """Collect unique labels organized by their groups."""
+    def _collect_labels_by_group(self, labels: List[dict],
+                                 names: List[str]) -> Dict[str, Dict]:
+        """Collect unique labels organized by their groups.
+        
+        Takes the label and name columns in oldest-first order and walks
+        them newest-first, so the newest lap's copy of a label wins.
+        """
         labels_by_group = {}
+        seen = set()
         
-        for lap in laps:
-            label = lap['lbl']
-            label_name = label['name']
-            label_group = label.get('group', 'Default')
-            
-            if label_group not in labels_by_group:
-                labels_by_group[label_group] = {}
-            
-            if label_name not in labels_by_group[label_group]:
-                labels_by_group[label_group][label_name] = {
-                    'color': label.get('color', [1, 1, 1, 0]),
-                    'desc': label.get('desc', ''),
-                    'auto_startstop': label.get('auto_startstop', False)
-                }
+        for i in range(len(labels) - 1, -1, -1):
+            label = labels[i]
+            key = (label.get('group', 'Default'), names[i])
+            
+            # One set probe per lap; only first sightings touch the dicts
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            labels_by_group.setdefault(key[0], {})[key[1]] = {
+                'color': label.get('color', [1, 1, 1, 0]),
+                'desc': label.get('desc', ''),
+                'auto_startstop': label.get('auto_startstop', False)
+            }
         
         return labels_by_group
     
     def _format_timestamp(self, saved_at: str) -> str:
-        """Format timestamp for filename."""
-        if saved_at:
+        """Format timestamp for filename.
+        
+        Only strings shaped like an ISO timestamp (YYYY-MM-DDTHH:MM:SS...)
+        are parsed, so malformed values fall back to the current time
+        without raising.
+        """
+        from datetime import datetime
+        
+        dt = None
+        if (saved_at and len(saved_at) >= 19 and
+                saved_at[4] == '-' and saved_at[7] == '-'):
             try:
                 dt = datetime.fromisoformat(saved_at)
-                return dt.strftime("%Y%m%d_%H%M%S")
-            except:
+            except ValueError:
                 pass
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+        if dt is None:
+            dt = datetime.now()
+        
+        return (f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_"
+                f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}")
     
-    def _export_platform_specific(self, filename: str, content: List[List[str]],
+    def _export_platform_specific(self, filename: str, content: bytes,
                                   success_callback: Optional[callable],
                                   error_callback: Optional[callable]) -> bool:
         """Export CSV using platform-appropriate method."""
+        platform = self._get_platform()
         if platform == 'android':
             return self._export_android(filename, content, success_callback, error_callback)
         elif platform == 'ios':
@@ -172,7 +255,7 @@ class CSVExporter:
         else:
             return self._export_desktop(filename, content, success_callback, error_callback)
     
-    def _export_desktop(self, filename: str, content: List[List[str]],
+    def _export_desktop(self, filename: str, content: bytes,
                        success_callback: Optional[callable],
                        error_callback: Optional[callable]) -> bool:
         """Export CSV on desktop using native file dialog."""
@@ -199,31 +282,32 @@ class CSVExporter:
                 if success_callback:
                     success_callback(filepath)
                 
-                print(f"✅ CSV exported: {filepath}")
+                log.debug("CSV exported: %s", filepath)
                 return True
             else:
-                print("Export cancelled")
+                log.debug("Export cancelled")
                 return False
                 
         except ImportError:
-            print("⚠️ tkinter not available, using fallback")
+            log.warning("tkinter not available, using fallback")
             return self._export_fallback(filename, content, success_callback, error_callback)
         except Exception as e:
-            print(f"❌ Desktop export error: {e}")
+            log.error("Desktop export error: %s", e)
             if error_callback:
                 error_callback(str(e))
             return False
     
-    def _export_android(self, filename: str, content: List[List[str]],
+    def _export_android(self, filename: str, content: bytes,
                        success_callback: Optional[callable],
                        error_callback: Optional[callable]) -> bool:
         """Export CSV on Android - REQUEST PERMISSIONS FIRST, THEN WAIT."""
-        print(f"🤖 ANDROID EXPORT START")
+        log.debug("Android export start")
         
         try:
             from android.permissions import request_permissions, Permission, check_permission
+            from kivy.clock import Clock
             
-            print(f"📦 Requesting permissions...")
+            log.debug("Requesting permissions")
             
             # Request permissions
             request_permissions([
@@ -239,7 +323,7 @@ class CSVExporter:
                 )
             
             # Wait 2 seconds for user to grant permission
-            print(f"⏳ Waiting for permission grant (2 seconds)...")
+            log.debug("Waiting for permission grant (2 seconds)")
             Clock.schedule_once(do_export_after_permission, 2.0)
             
             # Return True immediately - actual result will be in callback
@@ -247,22 +331,21 @@ class CSVExporter:
             
         except Exception as e:
             error_msg = f"Android export failed: {str(e)}"
-            print(f"❌ {error_msg}")
-            import traceback
-            traceback.print_exc()
+            log.exception(error_msg)
             
             if error_callback:
                 error_callback(error_msg)
             
             return False
     
-    def _do_android_export_with_permission(self, filename: str, content: List[List[str]],
+    def _do_android_export_with_permission(self, filename: str, content: bytes,
                                           success_callback: Optional[callable],
                                           error_callback: Optional[callable]) -> bool:
         """Actually do the Android export AFTER permissions are granted."""
-        print(f"🤖 ANDROID EXPORT - After permission wait")
+        log.debug("Android export after permission wait")
         
         try:
+            import threading
             from jnius import autoclass
             from android.permissions import check_permission, Permission
             
@@ -270,9 +353,7 @@ class CSVExporter:
             has_write = check_permission(Permission.WRITE_EXTERNAL_STORAGE)
             has_read = check_permission(Permission.READ_EXTERNAL_STORAGE)
             
-            print(f"📋 Permissions: WRITE={has_write}, READ={has_read}")
-            
-            print(f"📦 Importing Android modules...")
+            log.debug("Permissions: WRITE=%s, READ=%s", has_write, has_read)
             
             PythonActivity = autoclass('org.kivy.android.PythonActivity')
             Environment = autoclass('android.os.Environment')
@@ -287,9 +368,9 @@ class CSVExporter:
             try:
                 app_external_dir = context.getExternalFilesDir(None)
                 paths_to_try.append(('App Files', app_external_dir))
-                print(f"✅ Found App External: {app_external_dir.getAbsolutePath()}")
+                log.debug("Found App External directory")
             except Exception as e:
-                print(f"⚠️ Could not access App External: {e}")
+                log.warning("Could not access App External: %s", e)
             
             # 2. Downloads directory (if we have permission)
             if has_write:
@@ -298,9 +379,9 @@ class CSVExporter:
                         Environment.DIRECTORY_DOWNLOADS
                     )
                     paths_to_try.insert(0, ('Downloads', downloads_dir))
-                    print(f"✅ Found Downloads: {downloads_dir.getAbsolutePath()}")
+                    log.debug("Found Downloads directory")
                 except Exception as e:
-                    print(f"⚠️ Could not access Downloads: {e}")
+                    log.warning("Could not access Downloads: %s", e)
             
             # 3. Documents directory (if we have permission)
             if has_write:
@@ -309,43 +390,48 @@ class CSVExporter:
                         Environment.DIRECTORY_DOCUMENTS
                     )
                     paths_to_try.append(('Documents', docs_dir))
-                    print(f"✅ Found Documents: {docs_dir.getAbsolutePath()}")
+                    log.debug("Found Documents directory")
                 except Exception as e:
-                    print(f"⚠️ Could not access Documents: {e}")
+                    log.warning("Could not access Documents: %s", e)
             
             # 4. Internal app directory (always works)
             try:
                 app_internal_dir = context.getFilesDir()
                 paths_to_try.append(('Internal', app_internal_dir))
-                print(f"✅ Found Internal: {app_internal_dir.getAbsolutePath()}")
+                log.debug("Found Internal directory")
             except Exception as e:
-                print(f"⚠️ Could not access Internal: {e}")
+                log.warning("Could not access Internal: %s", e)
             
             # Try each path until one works
             last_error = None
             for path_name, directory in paths_to_try:
                 try:
-                    print(f"\n🔄 Trying {path_name}...")
+                    log.debug("Trying %s", path_name)
                     
                     # Create full path
                     file_obj = File(directory, filename)
                     full_path = file_obj.getAbsolutePath()
                     
-                    print(f"💾 Writing to: {full_path}")
+                    log.debug("Writing to: %s", full_path)
                     
                     # Write file
                     self._write_csv_file(full_path, content)
-                    print(f"✅ File written successfully!")
+                    log.debug("File written")
                     
-                    # Try to notify media scanner
-                    self._notify_media_scanner(context, file_obj)
+                    # Notify media scanner in the background so the
+                    # broadcast doesn't hold up the share dialog
+                    threading.Thread(
+                        target=self._notify_media_scanner,
+                        args=(context, file_obj),
+                        daemon=True
+                    ).start()
                     
                     # Try to open share dialog
                     try:
                         self._android_share_file(full_path, context)
-                        print(f"✅ Share dialog opened")
+                        log.debug("Share dialog opened")
                     except Exception as share_error:
-                        print(f"⚠️ Share dialog failed: {share_error}")
+                        log.warning("Share dialog failed: %s", share_error)
                         # Not critical if share fails
                     
                     # Success!
@@ -357,12 +443,12 @@ class CSVExporter:
                     
                 except Exception as e:
                     last_error = e
-                    print(f"❌ {path_name} failed: {e}")
+                    log.warning("%s failed: %s", path_name, e)
                     continue
             
             # All paths failed
             error_msg = f"All export paths failed. Last error: {last_error}"
-            print(f"❌ {error_msg}")
+            log.error(error_msg)
             
             if error_callback:
                 error_callback(error_msg)
@@ -371,9 +457,7 @@ class CSVExporter:
             
         except Exception as e:
             error_msg = f"Android export (after permission) failed: {str(e)}"
-            print(f"❌ {error_msg}")
-            import traceback
-            traceback.print_exc()
+            log.exception(error_msg)
             
             if error_callback:
                 error_callback(error_msg)
@@ -381,7 +465,11 @@ class CSVExporter:
             return False
     
     def _notify_media_scanner(self, context, file_obj):
-        """Notify Android media scanner so file appears in file manager."""
+        """Notify Android media scanner so file appears in file manager.
+        
+        Runs on a worker thread, so the thread is detached from the JVM
+        before it exits.
+        """
         try:
             from jnius import autoclass
             
@@ -392,9 +480,15 @@ class CSVExporter:
             file_uri = Uri.fromFile(file_obj)
             scan_intent.setData(file_uri)
             context.sendBroadcast(scan_intent)
-            print(f"✅ Media scanner notified")
+            log.debug("Media scanner notified")
         except Exception as e:
-            print(f"⚠️ Media scanner failed: {e}")
+            log.warning("Media scanner failed: %s", e)
+        finally:
+            try:
+                from jnius import detach
+                detach()
+            except Exception:
+                pass
     
     def _android_share_file(self, filepath: str, context):
         """Open Android share dialog for a file."""
@@ -410,16 +504,18 @@ class CSVExporter:
             
             # Try FileProvider first (Android 7+)
             try:
-                print(f"📤 Trying FileProvider...")
                 FileProvider = autoclass('androidx.core.content.FileProvider')
-                authority = f"{context.getPackageName()}.fileprovider"
+                authority = self._cached_authority
+                if authority is None:
+                    authority = f"{context.getPackageName()}.fileprovider"
+                    self._cached_authority = authority
                 file_uri = FileProvider.getUriForFile(context, authority, file_obj)
-                print(f"✅ FileProvider URI: {file_uri.toString()}")
+                log.debug("Using FileProvider URI")
             except Exception as fp_error:
-                print(f"⚠️ FileProvider failed: {fp_error}")
+                log.warning("FileProvider failed: %s", fp_error)
                 # Fallback to file:// URI (Android 6 and below)
                 file_uri = Uri.fromFile(file_obj)
-                print(f"⚠️ Using file URI: {file_uri.toString()}")
+                log.debug("Falling back to file:// URI")
             
             # Create share intent
             intent = Intent()
@@ -435,10 +531,10 @@ class CSVExporter:
             context.startActivity(chooser)
             
         except Exception as e:
-            print(f"❌ Share dialog error: {e}")
+            log.error("Share dialog error: %s", e)
             raise
     
-    def _export_ios(self, filename: str, content: List[List[str]],
+    def _export_ios(self, filename: str, content: bytes,
                    success_callback: Optional[callable],
                    error_callback: Optional[callable]) -> bool:
         """Export CSV on iOS using share sheet."""
@@ -474,7 +570,7 @@ class CSVExporter:
                 root_vc.presentViewController_animated_completion_(
                     activity_vc, True, None
                 )
-                print("✅ iOS share sheet opened")
+                log.debug("iOS share sheet opened")
                 
                 if success_callback:
                     success_callback(filename)
@@ -483,12 +579,12 @@ class CSVExporter:
             
         except Exception as e:
             error_msg = f"iOS export failed: {str(e)}"
-            print(f"❌ {error_msg}")
+            log.error(error_msg)
             if error_callback:
                 error_callback(error_msg)
             return False
     
-    def _export_fallback(self, filename: str, content: List[List[str]],
+    def _export_fallback(self, filename: str, content: bytes,
                         success_callback: Optional[callable],
                         error_callback: Optional[callable]) -> bool:
         """Fallback export method - save to exports directory."""
@@ -500,19 +596,29 @@ class CSVExporter:
             if success_callback:
                 success_callback(full_path)
             
-            print(f"✅ CSV exported (fallback): {full_path}")
+            log.debug("CSV exported (fallback): %s", full_path)
             return True
             
         except Exception as e:
             error_msg = f"Fallback export failed: {str(e)}"
-            print(f"❌ {error_msg}")
+            log.error(error_msg)
             if error_callback:
                 error_callback(error_msg)
             return False
     
-    def _write_csv_file(self, filepath: str, content: List[List[str]]) -> None:
-        """Write CSV content to file."""
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            for row in content:
-                writer.writerow(row)
\ No newline at end of file
+    def _write_csv_file(self, filepath: str, data: bytes) -> None:
+        """Write serialized CSV data straight to a file descriptor.
+        
+        Skips Python's buffered file layer since the payload is written
+        in one go anyway. O_BINARY keeps Windows from translating the
+        encoded line endings.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(filepath, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
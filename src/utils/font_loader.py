@@ -5,12 +5,155 @@ specifically Font Awesome icons used throughout the UI.
 """
 
 import os
+import shutil
+import threading
+import time
 import urllib.request
+import weakref
+from kivy.clock import Clock
 from kivy.core.text import LabelBase
 
 from constants import ICON_FONT, ICON_FONT_FILE, ICON_FONT_URL
 
 
+_FONT_READY = False
+"""bool: Whether the font has already been registered in this process."""
+
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+"""int: Read size used when streaming the font download to disk."""
+
+_PLACEHOLDER_FONT = 'data/fonts/Roboto-Regular.ttf'
+"""str: Kivy's bundled font, registered as a stand-in while downloading."""
+
+_download_thread = None
+"""Optional[threading.Thread]: Background download in progress, if any."""
+
+_DOWNLOAD_ATTEMPTS = 3
+"""int: Downloads tried in the background before keeping the placeholder."""
+
+_RETRY_DELAY = 30
+"""int: Seconds the background download waits before trying again."""
+
+_icon_labels = weakref.WeakSet()
+"""WeakSet[Label]: Icon labels to redraw once the real font is registered."""
+
+
+def track_icon_label(label) -> None:
+    """Register a label that renders Font Awesome icons.
+    
+    Widgets and screens call this for their icon labels (and markup
+    labels using the icon font), so the labels are redrawn when a
+    background download replaces the placeholder font, even if they are
+    not attached to the Window at that moment. Does nothing once the
+    real font is registered.
+    
+    Args:
+        label: Label (or Button) drawing icons
+    """
+    if not _FONT_READY:
+        _icon_labels.add(label)
+
+
+def _download_font() -> None:
+    """Stream the font file from the CDN to disk.
+    
+    The data is written to a temporary file first and moved into place
+    only when complete, so an interrupted download never leaves a
+    truncated TTF behind.
+    
+    Raises:
+        Exception: Any network or file error from the download
+    """
+    tmp_path = ICON_FONT_FILE + '.part'
+    try:
+        with urllib.request.urlopen(ICON_FONT_URL, timeout=10) as response, \
+                open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(response, f, _DOWNLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, ICON_FONT_FILE)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _font_file_present() -> bool:
+    """Check whether a usable font file exists (an empty file counts as missing)."""
+    try:
+        return os.stat(ICON_FONT_FILE).st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def _ensure_font_downloaded() -> bool:
+    """Download the font file if it is not present yet.
+    
+    Only touches the network and filesystem, so it is safe to run
+    on a worker thread.
+    
+    Returns:
+        True if the font file is available, False if the download failed
+    """
+    if _font_file_present():
+        return True
+    
+    print("📦 Downloading Font Awesome...")
+    try:
+        _download_font()
+        print("✅ Font Awesome downloaded successfully!")
+        return True
+    except Exception as e:
+        print(f"❌ Error downloading font: {e}")
+        return False
+
+
+def _register_font() -> bool:
+    """Register the downloaded font with Kivy. Must run on the main thread.
+    
+    Returns:
+        True if registration succeeded, False on error
+    """
+    global _FONT_READY
+    
+    try:
+        LabelBase.register(name=ICON_FONT, fn_regular=ICON_FONT_FILE)
+        _FONT_READY = True
+        print("✅ Font Awesome loaded successfully!")
+        return True
+    except Exception as e:
+        print(f"❌ Error loading font: {e}")
+        return False
+
+
+def _on_font_downloaded(dt: float) -> None:
+    """Register the font after a background download and redraw icon labels.
+    
+    Args:
+        dt: Delta time from Clock (unused)
+    """
+    if not _register_font():
+        return
+    
+    # Labels built while the placeholder was registered keep their old
+    # texture until they are re-rendered
+    for label in list(_icon_labels):
+        label.texture_update()
+    _icon_labels.clear()
+
+
+def _download_worker() -> None:
+    """Thread target: download the font, then hop back to the main thread.
+    
+    A failed download is retried a few times, so a short network outage
+    at startup doesn't leave the placeholder font in place for the whole
+    session.
+    """
+    for attempt in range(_DOWNLOAD_ATTEMPTS):
+        if attempt:
+            time.sleep(_RETRY_DELAY)
+        if _ensure_font_downloaded():
+            Clock.schedule_once(_on_font_downloaded)
+            return
+
+
 def download_font_awesome() -> bool:
     """Download and register the Font Awesome font.
     
@@ -23,27 +166,28 @@ def download_font_awesome() -> bool:
     
     Returns:
         True if font was successfully loaded/registered, False on error
-        
+        or while a background download is still running
+    
     Note:
-        If the font file already exists locally, it skips the download
-        and proceeds directly to registration.
+        If the font file already exists locally, it is registered right
+        away. Otherwise Kivy's default font is registered under the icon
+        font name so the UI can be built, and the download runs on a
+        background thread; the real font is registered on the main thread
+        once it arrives (retrying failed downloads a few times), and the
+        labels passed to track_icon_label are re-rendered. Once registered, further calls in the same process
+        return immediately.
     """
-    # Check if font file already exists
-    if not os.path.exists(ICON_FONT_FILE):
-        print("📦 Downloading Font Awesome...")
-        
-        try:
-            urllib.request.urlretrieve(ICON_FONT_URL, ICON_FONT_FILE)
-            print("✅ Font Awesome downloaded successfully!")
-        except Exception as e:
-            print(f"❌ Error downloading font: {e}")
-            return False
-    
-    # Register the font with Kivy
-    try:
-        LabelBase.register(name=ICON_FONT, fn_regular=ICON_FONT_FILE)
-        print("✅ Font Awesome loaded successfully!")
+    global _download_thread
+    
+    if _FONT_READY:
         return True
-    except Exception as e:
-        print(f"❌ Error loading font: {e}")
-        return False
\ No newline at end of file
+    
+    if _font_file_present():
+        return _register_font()
+    
+    if _download_thread is None:
+        LabelBase.register(name=ICON_FONT, fn_regular=_PLACEHOLDER_FONT)
+        _download_thread = threading.Thread(target=_download_worker, daemon=True)
+        _download_thread.start()
+    
+    return False
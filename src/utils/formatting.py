@@ -5,6 +5,10 @@ human-readable string formats suitable for display in the UI.
 """
 
 
+_last_prefix = (-1, "")
+"""tuple[int, str]: Last whole-seconds value and its formatted "M:SS." prefix."""
+
+
 def format_time(seconds: float) -> str:
     """Convert seconds to a formatted time string.
     
@@ -27,8 +31,16 @@ def format_time(seconds: float) -> str:
         >>> format_time(0.123)
         '0:00.123'
     """
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    global _last_prefix
+    
+    whole, millis = divmod(int(seconds * 1000), 1000)
+    
+    # The timer ticks many times per second; reuse the "M:SS." part
+    # until the whole-seconds value changes
+    cached_whole, prefix = _last_prefix
+    if whole != cached_whole:
+        minutes, secs = divmod(whole, 60)
+        prefix = f"{minutes}:{secs:02d}."
+        _last_prefix = (whole, prefix)
     
-    return f"{minutes}:{secs:02d}.{millis:03d}"
\ No newline at end of file
+    return f"{prefix}{millis:03d}"
\ No newline at end of file
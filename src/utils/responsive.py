@@ -4,11 +4,71 @@ This module provides utilities for making the app responsive across
 different device sizes, from small phones to tablets and desktops.
 """
 
+from enum import IntEnum
+from functools import wraps
+
 from kivy.core.window import Window
 from kivy.metrics import dp, sp
 from kivy.utils import platform
 
 
+_IS_MOBILE = platform in ('android', 'ios')
+"""bool: Whether running on a mobile platform; fixed for the process lifetime."""
+
+_cache = {}
+"""dict: Memoized getter and rh()/rfs() results, cleared whenever the window is resized."""
+
+
+def _cached(func):
+    """Memoize a size getter until the next window resize.
+    
+    Layouts query the same sizes dozens of times while being built, and
+    the results only change when the window does.
+    """
+    key = func.__name__
+    
+    @wraps(func)
+    def wrapper():
+        try:
+            return _cache[key]
+        except KeyError:
+            value = _cache[key] = func()
+            return value
+    
+    return wrapper
+
+
+Window.bind(size=lambda *_: _cache.clear())
+
+# Display density is fixed for the process lifetime, so every dp/sp
+# constant used below is converted once at import
+_DP = {v: dp(v) for v in (6, 8, 10, 12, 32, 36, 40, 44, 48, 50, 52, 56,
+                          60, 64, 70, 72, 80, 90, 100, 110, 120, 400)}
+"""dict[int, float]: Pixel values of the dp constants used by the getters."""
+
+_SP = {v: sp(v) for v in (16, 18, 20, 28, 42)}
+"""dict[int, float]: Scaled values of the sp constants used by the getters."""
+
+_MOBILE_FONT_SIZES = {
+    'header': '14sp',
+    'title': '16sp',
+    'button': '14sp',
+    'icon': '15sp',
+}
+"""dict: Fixed font sizes on mobile, capped for high-density displays."""
+
+_DESKTOP_FONT_SIZES = {
+    'header': f"{_SP[16]}sp",
+    'title': f"{_SP[20]}sp",
+    'button': f"{_SP[16]}sp",
+    'icon': f"{_SP[18]}sp",
+}
+"""dict: Font sizes on desktop, formatted once at import."""
+
+_FONT_SIZES = _MOBILE_FONT_SIZES if _IS_MOBILE else _DESKTOP_FONT_SIZES
+"""dict: Font size table for the current platform."""
+
+
 class ResponsiveSize:
     """Helper class for responsive sizing based on screen dimensions.
     
@@ -20,201 +80,257 @@ class ResponsiveSize:
     @staticmethod
     def is_mobile() -> bool:
         """Check if running on mobile platform."""
-        return platform in ('android', 'ios')
+        return _IS_MOBILE
     
     @staticmethod
+    @_cached
     def get_header_height() -> float:
         """Get responsive height for header bars."""
-        # if ResponsiveSize.is_mobile():
+        # if _IS_MOBILE:
         #     return dp(42)
-        return dp(56)
+        return _DP[56]
     
     @staticmethod
+    @_cached
     def get_button_height() -> float:
         """Get responsive height for standard buttons."""
-        if ResponsiveSize.is_mobile():
-            return dp(44)  # iOS standard touch target
-        return dp(50)
+        if _IS_MOBILE:
+            return _DP[44]  # iOS standard touch target
+        return _DP[50]
     
     @staticmethod
+    @_cached
     def get_large_button_height() -> float:
         """Get responsive height for large action buttons."""
-        if ResponsiveSize.is_mobile():
-            return dp(52)
-        return dp(60)
+        if _IS_MOBILE:
+            return _DP[52]
+        return _DP[60]
     
     @staticmethod
+    @_cached
     def get_footer_height() -> float:
         """Get responsive height for footer with buttons."""
-        if ResponsiveSize.is_mobile():
+        width, height = Window.size
+        if _IS_MOBILE:
             # Mobile needs more padding for safe area
-            base_height = Window.height * 0.10
-            return max(min(base_height, dp(100)), dp(80))
+            base_height = height * 0.10
+            return max(min(base_height, _DP[100]), _DP[80])
         # Desktop
-        base_height = min(Window.height * 0.12, dp(110))
-        return max(base_height, dp(90))
+        base_height = min(height * 0.12, _DP[110])
+        return max(base_height, _DP[90])
     
     @staticmethod
+    @_cached
     def get_lap_row_height() -> float:
         """Get responsive height for lap rows."""
-        if ResponsiveSize.is_mobile():
-            return dp(56)
-        return dp(64)
+        if _IS_MOBILE:
+            return _DP[56]
+        return _DP[64]
     
     @staticmethod
+    @_cached
     def get_label_row_height() -> float:
         """Get responsive height for label management rows."""
-        if ResponsiveSize.is_mobile():
-            return dp(64)
-        return dp(72)
+        if _IS_MOBILE:
+            return _DP[64]
+        return _DP[72]
     
     @staticmethod
+    @_cached
     def get_time_display_height() -> float:
         """Get responsive height for time display area."""
-        if ResponsiveSize.is_mobile():
+        width, height = Window.size
+        if _IS_MOBILE:
             # Smaller on mobile
-            base_height = Window.height * 0.10
-            return max(min(base_height, dp(100)), dp(70))
+            base_height = height * 0.10
+            return max(min(base_height, _DP[100]), _DP[70])
         # Desktop
-        base_height = Window.height * 0.12
-        return max(min(base_height, dp(120)), dp(80))
+        base_height = height * 0.12
+        return max(min(base_height, _DP[120]), _DP[80])
     
     @staticmethod
+    @_cached
     def get_provisional_label_height() -> float:
         """Get responsive height for provisional label selector."""
-        if ResponsiveSize.is_mobile():
-            return dp(72)
-        return dp(80)
+        if _IS_MOBILE:
+            return _DP[72]
+        return _DP[80]
     
     @staticmethod
+    @_cached
     def get_time_font_size() -> str:
         """Get responsive font size for main time display."""
-        if ResponsiveSize.is_mobile():
+        width, height = Window.size
+        if _IS_MOBILE:
             # Cap maximum size for WQHD displays
-            base_size = Window.width * 0.09  # Reduced max
+            base_size = width * 0.09  # Reduced max
             return f"{base_size}sp"  # Hard cap at sp(22)
         # Desktop
-        base_size = min(Window.width * 0.10, sp(42))
-        return f"{max(base_size, sp(28))}sp"
+        base_size = min(width * 0.10, _SP[42])
+        return f"{max(base_size, _SP[28])}sp"
     
     @staticmethod
     def get_header_font_size() -> str:
         """Get responsive font size for headers."""
-        if ResponsiveSize.is_mobile():
-            return f"{min(sp(14), 14)}sp"  # Cap at 14sp for mobile
-        return f"{sp(16)}sp"
+        return _FONT_SIZES['header']
     
     @staticmethod
     def get_title_font_size() -> str:
         """Get responsive font size for titles."""
-        if ResponsiveSize.is_mobile():
-            return f"{min(sp(16), 16)}sp"  # Cap at 16sp for mobile
-        return f"{sp(20)}sp"
+        return _FONT_SIZES['title']
     
     @staticmethod
     def get_button_font_size() -> str:
         """Get responsive font size for buttons."""
-        if ResponsiveSize.is_mobile():
-            return f"{min(sp(14), 14)}sp"  # Cap at 14sp for mobile
-        return f"{sp(16)}sp"
+        return _FONT_SIZES['button']
     
     @staticmethod
     def get_icon_font_size() -> str:
         """Get responsive font size for icons."""
-        if ResponsiveSize.is_mobile():
-            return f"{min(sp(15), 15)}sp"  # Cap at 15sp for mobile
-        return f"{sp(18)}sp"
+        return _FONT_SIZES['icon']
     
     @staticmethod
+    @_cached
     def get_padding() -> float:
         """Get responsive padding value."""
-        if ResponsiveSize.is_mobile():
-            return dp(10)
-        return dp(12)
+        if _IS_MOBILE:
+            return _DP[10]
+        return _DP[12]
     
     @staticmethod
+    @_cached
     def get_spacing() -> float:
         """Get responsive spacing value."""
-        if ResponsiveSize.is_mobile():
-            return dp(6)
-        return dp(8)
+        if _IS_MOBILE:
+            return _DP[6]
+        return _DP[8]
     
     @staticmethod
+    @_cached
     def get_input_height() -> float:
         """Get responsive height for text inputs."""
-        if ResponsiveSize.is_mobile():
-            return dp(40)
-        return dp(44)
+        if _IS_MOBILE:
+            return _DP[40]
+        return _DP[44]
     
     @staticmethod
+    @_cached
     def get_popup_size_hint() -> tuple:
         """Get responsive size hint for popups."""
-        if ResponsiveSize.is_mobile():
+        width, height = Window.size
+        if _IS_MOBILE:
             # Nearly full screen on mobile for better usability
             return (0.95, 0.85)
         # More compact on desktop
-        if Window.width < dp(400):
+        if width < _DP[400]:
             return (0.95, 0.9)
         return (0.9, 0.85)
     
     @staticmethod
+    @_cached
     def get_color_picker_popup_size() -> tuple:
         """Get size hint specifically for color picker popups."""
-        if ResponsiveSize.is_mobile():
+        if _IS_MOBILE:
             # Color picker needs more vertical space
             return (0.95, 0.90)
         return (0.9, 0.88)
     
     @staticmethod
+    @_cached
     def get_add_button_size() -> float:
         """Get responsive size for floating add button."""
-        if ResponsiveSize.is_mobile():
-            return dp(56)  # Material Design standard FAB size
-        base_size = min(Window.width * 0.15, dp(72))
-        return max(base_size, dp(56))
+        width, height = Window.size
+        if _IS_MOBILE:
+            return _DP[56]  # Material Design standard FAB size
+        base_size = min(width * 0.15, _DP[72])
+        return max(base_size, _DP[56])
     
     @staticmethod
+    @_cached
     def get_add_button_container_height() -> float:
         """Get responsive height for add button container."""
         button_size = ResponsiveSize.get_add_button_size()
-        if ResponsiveSize.is_mobile():
-            return button_size + dp(32)
-        return button_size + dp(48)
+        if _IS_MOBILE:
+            return button_size + _DP[32]
+        return button_size + _DP[48]
     
     @staticmethod
+    @_cached
     def get_slider_height() -> float:
         """Get responsive height for sliders."""
-        if ResponsiveSize.is_mobile():
-            return dp(48)  # Larger touch target for mobile
-        return dp(36)
+        if _IS_MOBILE:
+            return _DP[48]  # Larger touch target for mobile
+        return _DP[36]
+
+
+# Lookup tables for the convenience functions, built once at import
+_RH_MAP = {
+    'header': ResponsiveSize.get_header_height,
+    'button': ResponsiveSize.get_button_height,
+    'large_button': ResponsiveSize.get_large_button_height,
+    'footer': ResponsiveSize.get_footer_height,
+    'lap_row': ResponsiveSize.get_lap_row_height,
+    'label_row': ResponsiveSize.get_label_row_height,
+    'time_display': ResponsiveSize.get_time_display_height,
+    'provisional_label': ResponsiveSize.get_provisional_label_height,
+    'input': ResponsiveSize.get_input_height,
+    'add_button': ResponsiveSize.get_add_button_size,
+    'add_button_container': ResponsiveSize.get_add_button_container_height,
+    'slider': ResponsiveSize.get_slider_height,
+}
+"""dict: Maps rh() component keys to their height getters."""
+
+_RFS_MAP = {
+    'time': ResponsiveSize.get_time_font_size,
+    'header': ResponsiveSize.get_header_font_size,
+    'title': ResponsiveSize.get_title_font_size,
+    'button': ResponsiveSize.get_button_font_size,
+    'icon': ResponsiveSize.get_icon_font_size,
+}
+"""dict: Maps rfs() component keys to their font size getters."""
+
+
+class Size(IntEnum):
+    """Integer rh() keys for the most frequently queried components.
+    
+    rh(Size.BUTTON) indexes a tuple instead of hashing a string key;
+    the string keys keep working for all components.
+    """
+    
+    BUTTON = 0
+    HEADER = 1
+    FOOTER = 2
+    INPUT = 3
+
+
+_RH_TABLE = (
+    ResponsiveSize.get_button_height,
+    ResponsiveSize.get_header_height,
+    ResponsiveSize.get_footer_height,
+    ResponsiveSize.get_input_height,
+)
+"""tuple: Height getters indexed by Size."""
 
 
 # Convenience functions for quick access
-def rh(key: str) -> float:
+def rh(key) -> float:
     """Get responsive height for a component.
     
     Args:
-        key: Component key (header, button, footer, etc.)
+        key: Size member, or component key string (header, button,
+            footer, etc.)
         
     Returns:
         Height in pixels
     """
-    mapping = {
-        'header': ResponsiveSize.get_header_height,
-        'button': ResponsiveSize.get_button_height,
-        'large_button': ResponsiveSize.get_large_button_height,
-        'footer': ResponsiveSize.get_footer_height,
-        'lap_row': ResponsiveSize.get_lap_row_height,
-        'label_row': ResponsiveSize.get_label_row_height,
-        'time_display': ResponsiveSize.get_time_display_height,
-        'provisional_label': ResponsiveSize.get_provisional_label_height,
-        'input': ResponsiveSize.get_input_height,
-        'add_button': ResponsiveSize.get_add_button_size,
-        'add_button_container': ResponsiveSize.get_add_button_container_height,
-        'slider': ResponsiveSize.get_slider_height,
-    }
-    
-    return mapping.get(key, ResponsiveSize.get_button_height)()
+    if isinstance(key, int):
+        return _RH_TABLE[key]()
+    
+    try:
+        return _cache['rh', key]
+    except KeyError:
+        value = _cache['rh', key] = _RH_MAP.get(key, ResponsiveSize.get_button_height)()
+        return value
 
 
 def rfs(key: str) -> str:
@@ -226,15 +342,11 @@ def rfs(key: str) -> str:
     Returns:
         Font size as string
     """
-    mapping = {
-        'time': ResponsiveSize.get_time_font_size,
-        'header': ResponsiveSize.get_header_font_size,
-        'title': ResponsiveSize.get_title_font_size,
-        'button': ResponsiveSize.get_button_font_size,
-        'icon': ResponsiveSize.get_icon_font_size,
-    }
-    
-    return mapping.get(key, ResponsiveSize.get_button_font_size)()
+    try:
+        return _cache['rfs', key]
+    except KeyError:
+        value = _cache['rfs', key] = _RFS_MAP.get(key, ResponsiveSize.get_button_font_size)()
+        return value
 
 
 def rp() -> float:
@@ -4,9 +4,16 @@ This module contains utility functions for managing window properties
 and ensuring consistent UI behavior across different screen sizes.
 """
 
+from fractions import Fraction
+
 from constants import ASPECT_RATIO
 
 
+_ASPECT = Fraction(ASPECT_RATIO).limit_denominator(1000)
+_AR_N, _AR_D = _ASPECT.numerator, _ASPECT.denominator
+"""int, int: ASPECT_RATIO as numerator/denominator for integer comparisons."""
+
+
 def enforce_aspect_ratio(window, width: int, height: int) -> None:
     """Maintain a fixed aspect ratio when the window is resized.
     
@@ -25,12 +32,26 @@ def enforce_aspect_ratio(window, width: int, height: int) -> None:
     Note:
         This function modifies window.size as a side effect.
     """
-    # Determine which dimension to constrain based on aspect ratio
-    if width / height > ASPECT_RATIO:
+    # Determine which dimension to constrain based on aspect ratio,
+    # using integer cross-multiplication to avoid float division
+    if width * _AR_D > height * _AR_N:
         # Width is too large, constrain it
-        width = int(height * ASPECT_RATIO)
+        width = (height * _AR_N) // _AR_D
     else:
         # Height is too large, constrain it
-        height = int(width / ASPECT_RATIO)
+        height = (width * _AR_D) // _AR_N
     
-    window.size = (width, height)
\ No newline at end of file
+    window.size = (width, height)
+
+
+def size_to_text_size(label, size) -> None:
+    """Keep a label's text_size equal to its size so its text wraps.
+    
+    Used as label.bind(size=size_to_text_size): one shared function
+    serves every label instead of a separate setter per label.
+    
+    Args:
+        label: Label whose size changed
+        size: The new size
+    """
+    label.text_size = size
@@ -4,12 +4,49 @@ This module provides enhanced button widgets that integrate with
 the application's theme system.
 """
 
+from math import cos, sin, pi
+from typing import Dict, List, Tuple
+
 from kivy.uix.button import Button
-from kivy.graphics import Color, RoundedRectangle
+from kivy.graphics import Color, Mesh, PopMatrix, PushMatrix, Translate
 
 from constants import SURFACE_LIGHT
 
 
+_CORNER_SEGMENTS = 10
+"""int: Arc segments per corner (same as Kivy's RoundedRectangle default)."""
+
+_FAN_INDICES = list(range(4 * (_CORNER_SEGMENTS + 1) + 2))
+"""List[int]: Mesh indices for a fan of center + perimeter + closing vertex."""
+
+# Corner order matches the fan winding: bottom-left, bottom-right,
+# top-right, top-left, each sweeping a quarter turn counter-clockwise
+_UNIT_CORNERS = tuple(
+    tuple(
+        (cos(pi + quarter * pi / 2 + step * (pi / 2) / _CORNER_SEGMENTS),
+         sin(pi + quarter * pi / 2 + step * (pi / 2) / _CORNER_SEGMENTS))
+        for step in range(_CORNER_SEGMENTS + 1)
+    )
+    for quarter in range(4)
+)
+"""tuple: Unit-circle arc points for each corner, in fan order."""
+
+
+def _corner_offsets(radius: float) -> Tuple[Tuple[Tuple[float, float], ...], ...]:
+    """Scale the unit corner arcs to a radius.
+    
+    Args:
+        radius: Corner radius in pixels
+        
+    Returns:
+        Four tuples of (dx, dy) offsets from each corner's arc center
+    """
+    return tuple(
+        tuple((dx * radius, dy * radius) for dx, dy in corner)
+        for corner in _UNIT_CORNERS
+    )
+
+
 class RButton(Button):
     """Rounded button with customizable color.
     
@@ -21,9 +58,13 @@ class RButton(Button):
         _color: Current RGBA color tuple
         _radius: Corner radius in pixels
         _color_instr: Canvas Color instruction for updates
-        _bg: Canvas RoundedRectangle instruction
+        _translate: Canvas Translate moving the mesh to the button's position
+        _bg: Canvas Mesh instruction drawing the rounded rectangle
     """
     
+    _radius_cache: Dict[int, tuple] = {}
+    """Corner arc offsets per radius, shared by all buttons."""
+    
     def __init__(self, color: tuple = SURFACE_LIGHT, radius: int = 14, **kwargs):
         """Initialize a rounded button.
         
@@ -41,21 +82,59 @@ class RButton(Button):
         self._color = color
         self._radius = radius
         
-        # Draw custom rounded background
+        # Draw custom rounded background. The mesh is built around the
+        # origin and moved by the Translate, so moving the button (while
+        # scrolling or sliding a menu) doesn't rebuild its vertices
         with self.canvas.before:
             self._color_instr = Color(*color)
-            self._bg = RoundedRectangle(radius=[radius])
+            PushMatrix()
+            self._translate = Translate()
+            self._bg = Mesh(mode='triangle_fan', indices=_FAN_INDICES)
+            PopMatrix()
         
-        self.bind(pos=self._update, size=self._update)
+        self.bind(pos=self._update_pos, size=self._update)
+        self._update_pos()
+        self._update()
+
+    def _update_pos(self, *args) -> None:
+        """Move the background along with the button."""
+        self._translate.xy = self.pos
 
     def _update(self, *args) -> None:
-        """Update background position and size when widget changes.
+        """Rebuild the background mesh when the button is resized.
         
         This ensures the rounded rectangle stays synchronized with
-        the button's position and size.
+        the button's size. The corner arcs come from a per-radius cache,
+        so only the translation to the four corners is computed here.
         """
-        self._bg.pos = self.pos
-        self._bg.size = self.size
+        w, h = self.size
+        radius = self._radius
+        
+        if 2 * radius <= w and 2 * radius <= h:
+            corners = self._radius_cache.get(radius)
+            if corners is None:
+                corners = self._radius_cache[radius] = _corner_offsets(radius)
+        else:
+            # Too small for the full radius: clamp like RoundedRectangle
+            radius = max(min(w, h) / 2, 0)
+            corners = _corner_offsets(radius)
+        
+        # Relative to the button's origin; _translate adds its position
+        centers = (
+            (radius, radius),
+            (w - radius, radius),
+            (w - radius, h - radius),
+            (radius, h - radius)
+        )
+        
+        # Fan around the button center; each vertex is (x, y, u, v)
+        vertices: List[float] = [w / 2, h / 2, 0, 0]
+        for (cx, cy), corner in zip(centers, corners):
+            for dx, dy in corner:
+                vertices += (cx + dx, cy + dy, 0, 0)
+        vertices += vertices[4:8]
+        
+        self._bg.vertices = vertices
 
     def set_color(self, color: tuple) -> None:
         """Change the button's background color.
@@ -2,6 +2,10 @@
 
 This module provides factory functions for creating common dialog types
 to avoid code duplication across screens.
+
+Each dialog kind is built once and cached; later calls reconfigure the
+same Popup in place and rebind its callbacks, so callers should not keep
+a reference to a dialog after it has been dismissed.
 """
 
 from typing import Callable, Optional
@@ -9,10 +13,196 @@ from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
+from kivy.graphics import Color, Rectangle
 
-from constants import TEXT, ACCENT, DANGER, SURFACE_LIGHT, PRIMARY
+from constants import TEXT, ACCENT, DANGER, SURFACE, SURFACE_LIGHT, PRIMARY
 from .buttons import RButton
-from utils import rh, rp, rs
+from utils import Size, rh, rp, rs, size_to_text_size
+
+
+class _FlatPopupContent(BoxLayout):
+    """Dialog content box drawn as a single solid rectangle.
+    
+    The popup's own background is left alone: on Kivy 1.9.1 (the
+    version the README recommends) background_color tints the window
+    overlay, and an empty background draws an untextured white body.
+    
+    Attributes:
+        bg_color: RGBA color of the background, shared by all dialogs
+    """
+    
+    bg_color = SURFACE
+    
+    def __init__(self, **kwargs):
+        """Initialize the content box and its background.
+        
+        Args:
+            **kwargs: Keyword arguments passed to BoxLayout
+        """
+        super().__init__(**kwargs)
+        
+        # A canvas instruction can only belong to one canvas, so each box
+        # has its own Color, all set from the shared class color
+        with self.canvas.before:
+            Color(*self.bg_color)
+            self._bg = Rectangle()
+        
+        self.bind(pos=self._sync_bg, size=self._sync_bg)
+    
+    def _sync_bg(self, *args) -> None:
+        """Keep the background rectangle aligned with the box."""
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+
+_DIALOG_CACHE = {}
+"""dict: Prebuilt (popup, refs) pairs keyed by dialog kind, reused across opens."""
+
+
+def _get_cached(kind: str, build: Callable[[], tuple]) -> tuple:
+    """Return the cached dialog of the given kind, building it on first use.
+    
+    If the cached popup is still on screen (a dialog opened from another
+    dialog of the same kind), a fresh uncached one is returned instead so
+    the visible dialog isn't reconfigured underneath the user.
+    
+    Args:
+        kind: Cache key identifying the dialog layout
+        build: Function returning a new (popup, refs) pair
+        
+    Returns:
+        Tuple of (popup, refs) where refs maps names to the inner widgets
+    """
+    entry = _DIALOG_CACHE.get(kind)
+    if entry is None:
+        entry = _DIALOG_CACHE[kind] = build()
+    elif entry[0].parent is not None:
+        return build()
+    return entry
+
+
+def _rebind(refs: dict, bindings: list) -> None:
+    """Swap the callbacks bound by the previous use of a cached dialog.
+    
+    Args:
+        refs: Widget references of the dialog; its 'uids' entry is replaced
+        bindings: List of (widget, event, callback) triples to bind
+    """
+    for widget, event, uid in refs['uids']:
+        widget.unbind_uid(event, uid)
+    refs['uids'] = [
+        (widget, event, widget.fbind(event, callback))
+        for widget, event, callback in bindings
+    ]
+
+
+def _reset_layout(content: BoxLayout) -> None:
+    """Re-apply responsive spacing and padding to a reused content box."""
+    content.spacing = rs()
+    content.padding = rp()
+
+
+def _build_text_input_dialog() -> tuple:
+    """Build the widget tree for create_text_input_dialog."""
+    prompt_label = Label(color=TEXT, size_hint_y=None)
+    text_input = TextInput(size_hint_y=None)
+    save_btn = RButton(color=ACCENT, size_hint_y=None)
+    
+    content = _FlatPopupContent(orientation="vertical")
+    content.add_widget(text_input)
+    content.add_widget(save_btn)
+    
+    popup = Popup(content=content)
+    refs = {
+        'content': content,
+        'prompt_label': prompt_label,
+        'input': text_input,
+        'save_btn': save_btn,
+        'uids': []
+    }
+    return popup, refs
+
+
+def _build_confirmation_dialog() -> tuple:
+    """Build the widget tree for create_confirmation_dialog."""
+    content = _FlatPopupContent(orientation="vertical")
+    
+    message_label = Label(color=TEXT, halign="center", valign="middle")
+    message_label.bind(size=size_to_text_size)
+    content.add_widget(message_label)
+    
+    # Button container
+    buttons = BoxLayout(size_hint_y=None)
+    cancel_btn = RButton(color=SURFACE_LIGHT)
+    confirm_btn = RButton()
+    buttons.add_widget(cancel_btn)
+    buttons.add_widget(confirm_btn)
+    content.add_widget(buttons)
+    
+    popup = Popup(content=content)
+    cancel_btn.bind(on_press=popup.dismiss)
+    
+    refs = {
+        'content': content,
+        'message_label': message_label,
+        'buttons': buttons,
+        'cancel_btn': cancel_btn,
+        'confirm_btn': confirm_btn,
+        'uids': []
+    }
+    return popup, refs
+
+
+def _build_info_dialog() -> tuple:
+    """Build the widget tree for create_info_dialog."""
+    content = _FlatPopupContent(orientation="vertical")
+    
+    message_label = Label(color=TEXT, halign="center", valign="middle")
+    message_label.bind(size=size_to_text_size)
+    content.add_widget(message_label)
+    
+    ok_btn = RButton(color=PRIMARY, size_hint_y=None)
+    content.add_widget(ok_btn)
+    
+    popup = Popup(content=content)
+    ok_btn.bind(on_press=popup.dismiss)
+    
+    refs = {
+        'content': content,
+        'message_label': message_label,
+        'ok_btn': ok_btn
+    }
+    return popup, refs
+
+
+def _build_two_button_dialog() -> tuple:
+    """Build the widget tree for create_two_button_dialog."""
+    input_field = TextInput(size_hint_y=None, multiline=False)
+    
+    buttons = BoxLayout(size_hint_y=None)
+    left_btn = RButton()
+    right_btn = RButton(color=ACCENT)
+    buttons.add_widget(left_btn)
+    buttons.add_widget(right_btn)
+    
+    prompt_label = Label(color=TEXT, size_hint_y=None)
+    
+    content = _FlatPopupContent(orientation="vertical")
+    content.add_widget(prompt_label)
+    content.add_widget(input_field)
+    content.add_widget(buttons)
+    
+    popup = Popup(content=content)
+    refs = {
+        'content': content,
+        'prompt_label': prompt_label,
+        'input': input_field,
+        'buttons': buttons,
+        'left_btn': left_btn,
+        'right_btn': right_btn,
+        'uids': []
+    }
+    return popup, refs
 
 
 def create_text_input_dialog(
@@ -38,44 +228,43 @@ def create_text_input_dialog(
     Returns:
         Configured Popup instance (not yet opened)
     """
-    text_input = TextInput(
-        text=initial_text,
-        hint_text=hint_text,
-        size_hint_y=None,
-        height=rh('input'),
-        multiline=multiline
-    )
-    
-    save_btn = RButton(
-        text=save_button_text,
-        color=ACCENT,
-        size_hint_y=None,
-        height=rh('button')
-    )
-    
-    content = BoxLayout(orientation="vertical", spacing=rs(), padding=rp())
+    popup, refs = _get_cached('text_input', _build_text_input_dialog)
+    content = refs['content']
+    prompt_label = refs['prompt_label']
+    text_input = refs['input']
+    save_btn = refs['save_btn']
     
-    if prompt:
-        prompt_label = Label(
-            text=prompt,
-            color=TEXT,
-            size_hint_y=None,
-            height=rp() * 2.5
-        )
-        content.add_widget(prompt_label)
+    _reset_layout(content)
     
-    content.add_widget(text_input)
-    content.add_widget(save_btn)
+    text_input.text = initial_text
+    text_input.hint_text = hint_text
+    text_input.multiline = multiline
+    text_input.height = rh(Size.INPUT)
+    
+    save_btn.text = save_button_text
+    save_btn.height = rh(Size.BUTTON)
     
-    popup = Popup(title=title, content=content, size_hint=(0.8, 0.25))
+    # The prompt row is only shown when there is a prompt
+    if prompt:
+        prompt_label.text = prompt
+        prompt_label.height = rp() * 2.5
+        if prompt_label.parent is None:
+            content.add_widget(prompt_label, index=len(content.children))
+    elif prompt_label.parent is not None:
+        content.remove_widget(prompt_label)
+    
+    popup.title = title
+    popup.size_hint = (0.8, 0.25)
     
     def handle_save(*args):
         if on_save:
             on_save(text_input.text)
         popup.dismiss()
     
-    save_btn.bind(on_press=handle_save)
-    text_input.bind(on_text_validate=handle_save)
+    _rebind(refs, [
+        (save_btn, 'on_press', handle_save),
+        (text_input, 'on_text_validate', handle_save)
+    ])
     
     return popup
 
@@ -101,40 +290,29 @@ def create_confirmation_dialog(
     Returns:
         Configured Popup instance (not yet opened)
     """
-    content = BoxLayout(orientation="vertical", spacing=rs(), padding=rp())
-    
-    message_label = Label(
-        text=message,
-        color=TEXT,
-        halign="center",
-        valign="middle"
-    )
-    message_label.bind(size=message_label.setter('text_size'))
-    content.add_widget(message_label)
+    popup, refs = _get_cached('confirmation', _build_confirmation_dialog)
+    _reset_layout(refs['content'])
     
-    # Button container
-    buttons = BoxLayout(size_hint_y=None, height=rh('button'), spacing=rs())
-    
-    cancel_btn = RButton(text=cancel_text, color=SURFACE_LIGHT)
-    confirm_btn = RButton(
-        text=confirm_text,
-        color=DANGER if danger else PRIMARY
-    )
+    refs['message_label'].text = message
     
-    buttons.add_widget(cancel_btn)
-    buttons.add_widget(confirm_btn)
-    content.add_widget(buttons)
+    buttons = refs['buttons']
+    buttons.height = rh(Size.BUTTON)
+    buttons.spacing = rs()
     
-    popup = Popup(title=title, content=content, size_hint=(0.7, 0.3))
+    refs['cancel_btn'].text = cancel_text
+    confirm_btn = refs['confirm_btn']
+    confirm_btn.text = confirm_text
+    confirm_btn.set_color(DANGER if danger else PRIMARY)
     
-    cancel_btn.bind(on_press=popup.dismiss)
+    popup.title = title
+    popup.size_hint = (0.7, 0.3)
     
     def handle_confirm(*args):
         if on_confirm:
             on_confirm()
         popup.dismiss()
     
-    confirm_btn.bind(on_press=handle_confirm)
+    _rebind(refs, [(confirm_btn, 'on_press', handle_confirm)])
     
     return popup
 
@@ -150,27 +328,17 @@ def create_info_dialog(title: str, message: str, button_text: str = "OK") -> Pop
     Returns:
         Configured Popup instance (not yet opened)
     """
-    content = BoxLayout(orientation="vertical", spacing=rs(), padding=rp())
-    
-    message_label = Label(
-        text=message,
-        color=TEXT,
-        halign="center",
-        valign="middle"
-    )
-    message_label.bind(size=message_label.setter('text_size'))
-    content.add_widget(message_label)
+    popup, refs = _get_cached('info', _build_info_dialog)
+    _reset_layout(refs['content'])
     
-    ok_btn = RButton(
-        text=button_text, 
-        color=PRIMARY, 
-        size_hint_y=None, 
-        height=rh('button')
-    )
-    content.add_widget(ok_btn)
+    refs['message_label'].text = message
     
-    popup = Popup(title=title, content=content, size_hint=(0.7, 0.25))
-    ok_btn.bind(on_press=popup.dismiss)
+    ok_btn = refs['ok_btn']
+    ok_btn.text = button_text
+    ok_btn.height = rh(Size.BUTTON)
+    
+    popup.title = title
+    popup.size_hint = (0.7, 0.25)
     
     return popup
 
@@ -202,35 +370,30 @@ def create_two_button_dialog(
     Returns:
         Configured Popup instance (not yet opened)
     """
-    input_field = TextInput(
-        text=input_text,
-        size_hint_y=None,
-        height=rh('input'),
-        multiline=False
-    )
+    popup, refs = _get_cached('two_button', _build_two_button_dialog)
+    _reset_layout(refs['content'])
     
-    buttons = BoxLayout(size_hint_y=None, height=rh('button'), spacing=rs())
+    prompt_label = refs['prompt_label']
+    prompt_label.text = prompt
+    prompt_label.height = rp() * 2.5
     
-    left_btn = RButton(
-        text=left_button_text,
-        color=DANGER if left_danger else SURFACE_LIGHT
-    )
-    right_btn = RButton(text=right_button_text, color=ACCENT)
+    input_field = refs['input']
+    input_field.text = input_text
+    input_field.height = rh(Size.INPUT)
     
-    buttons.add_widget(left_btn)
-    buttons.add_widget(right_btn)
+    buttons = refs['buttons']
+    buttons.height = rh(Size.BUTTON)
+    buttons.spacing = rs()
     
-    content = BoxLayout(orientation="vertical", spacing=rs(), padding=rp())
-    content.add_widget(Label(
-        text=prompt,
-        color=TEXT,
-        size_hint_y=None,
-        height=rp() * 2.5
-    ))
-    content.add_widget(input_field)
-    content.add_widget(buttons)
+    left_btn = refs['left_btn']
+    left_btn.text = left_button_text
+    left_btn.set_color(DANGER if left_danger else SURFACE_LIGHT)
     
-    popup = Popup(title=title, content=content, size_hint=(0.8, 0.35))
+    right_btn = refs['right_btn']
+    right_btn.text = right_button_text
+    
+    popup.title = title
+    popup.size_hint = (0.8, 0.35)
     
     def handle_left(*args):
         popup.dismiss()
@@ -242,8 +405,10 @@ def create_two_button_dialog(
             on_right(input_field.text)
         popup.dismiss()
     
-    left_btn.bind(on_press=handle_left)
-    right_btn.bind(on_press=handle_right)
-    input_field.bind(on_text_validate=handle_right)
+    _rebind(refs, [
+        (left_btn, 'on_press', handle_left),
+        (right_btn, 'on_press', handle_right),
+        (input_field, 'on_text_validate', handle_right)
+    ])
     
-    return popup
\ No newline at end of file
+    return popup
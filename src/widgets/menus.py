@@ -4,13 +4,14 @@ This module provides menu widgets that slide in from screen edges,
 commonly used for save state management and settings.
 """
 
+from functools import lru_cache
+from typing import Optional
 from kivy.uix.modalview import ModalView
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
-from kivy.uix.widget import Widget
-from kivy.graphics import Color, Rectangle
+from kivy.graphics import Color, Mesh, Rectangle
 from kivy.animation import Animation
 
 from constants import (TEXT, MUTED, ACCENT, DANGER, PRIMARY, SURFACE_LIGHT,
@@ -18,7 +19,58 @@ from constants import (TEXT, MUTED, ACCENT, DANGER, PRIMARY, SURFACE_LIGHT,
                       ICON_CALENDAR)
 from widgets import RButton
 from widgets.dialogs import create_text_input_dialog, create_confirmation_dialog
-from utils import rh, rfs, rp, rs
+from utils import (Size, format_time, rh, rfs, rp, rs, size_to_text_size,
+                   track_icon_label)
+
+
+@lru_cache(maxsize=256)
+def _fmt_time(seconds: float) -> str:
+    """Format a save state's total time, reusing results across refreshes.
+    
+    Saved times don't change while the menu is open, so after the first
+    render every refresh hits the cache.
+    """
+    return format_time(seconds)
+
+
+class _RowBackgroundGrid(GridLayout):
+    """Grid that draws the backgrounds of all its rows as a single Mesh.
+    
+    Every row box gets a flat background rectangle. The mesh is rebuilt
+    after each layout pass, once the row positions are final, so rows
+    need no canvas instructions or position bindings of their own.
+    """
+    
+    def __init__(self, **kwargs):
+        """Initialize the grid and its background mesh.
+        
+        Args:
+            **kwargs: Keyword arguments passed to GridLayout
+        """
+        super().__init__(**kwargs)
+        with self.canvas.before:
+            Color(0.14, 0.14, 0.14, 1)
+            self._row_mesh = Mesh(mode='triangles')
+    
+    def do_layout(self, *args) -> None:
+        """Lay out the rows, then redraw their backgrounds in one go."""
+        super().do_layout(*args)
+        
+        vertices = []
+        indices = []
+        for child in self.children:
+            # Placeholder labels have no background, only row boxes do
+            if not isinstance(child, BoxLayout):
+                continue
+            x, y = child.pos
+            right, top = x + child.width, y + child.height
+            base = len(vertices) // 4
+            vertices += (x, y, 0, 0, right, y, 0, 0,
+                         right, top, 0, 0, x, top, 0, 0)
+            indices += (base, base + 1, base + 2, base, base + 2, base + 3)
+        
+        self._row_mesh.vertices = vertices
+        self._row_mesh.indices = indices
 
 
 class SlideMenu(ModalView):
@@ -31,6 +83,13 @@ class SlideMenu(ModalView):
         timer_screen: Reference to TimerScreen instance
         menu_container: Main container for menu content
         states_grid: Grid layout containing save state entries
+        _row_widgets: Row widget per displayed save state name
+        _row_pool: Detached row widgets kept for reuse by later refreshes,
+            across opens as TimerScreen keeps a single menu
+        _empty_label: Placeholder shown when there are no save states
+        _loading_label: Placeholder shown until the list is first loaded
+        _btn_actions: (action, state name) per row button, keyed by id()
+        _anim: Slide animation currently running, if any
     """
     
     def __init__(self, timer_screen, **kwargs):
@@ -48,6 +107,12 @@ class SlideMenu(ModalView):
         super().__init__(**kwargs)
         
         self.timer_screen = timer_screen
+        self._row_widgets = {}
+        self._row_pool = []
+        self._empty_label = None
+        self._loading_label = None
+        self._btn_actions = {}
+        self._anim = None
         
         # Create menu container
         self.menu_container = BoxLayout(
@@ -60,22 +125,25 @@ class SlideMenu(ModalView):
         with self.menu_container.canvas.before:
             Color(0.1, 0.1, 0.1, 1)
             self.menu_container.bg = Rectangle()
-        self.menu_container.bind(
-            pos=lambda *_: setattr(self.menu_container.bg, 'pos', 
-                                  self.menu_container.pos),
-            size=lambda *_: setattr(self.menu_container.bg, 'size', 
-                                   self.menu_container.size)
-        )
+        self.menu_container.bind(pos=self._sync_bg, size=self._sync_bg)
         
-        self._build_menu()
+        # Menu content is built on first open
+        self._built = False
         self.add_widget(self.menu_container)
     
+    def _sync_bg(self, *args) -> None:
+        """Keep the menu background rectangle aligned with its container."""
+        container = self.menu_container
+        bg = container.bg
+        bg.pos = container.pos
+        bg.size = container.size
+    
     def _build_menu(self) -> None:
         """Build the menu structure with header, content, and footer."""
         # Header
         header = BoxLayout(
             size_hint_y=None, 
-            height=rh('header') + rp() * 2, 
+            height=rh(Size.HEADER) + rp() * 2, 
             padding=rp() + 8
         )
         header_label = Label(
@@ -85,12 +153,12 @@ class SlideMenu(ModalView):
             halign="left",
             valign="middle"
         )
-        header_label.bind(size=header_label.setter('text_size'))
+        header_label.bind(size=size_to_text_size)
         header.add_widget(header_label)
         
         # Scrollable content area
         scroll = ScrollView()
-        self.states_grid = GridLayout(
+        self.states_grid = _RowBackgroundGrid(
             cols=1,
             spacing=rs(),
             size_hint_y=None,
@@ -102,7 +170,7 @@ class SlideMenu(ModalView):
         # Footer with action buttons
         footer = BoxLayout(
             size_hint_y=None,
-            height=rh('footer') + rp(),
+            height=rh(Size.FOOTER) + rp(),
             padding=rp() + 8,
             spacing=rs() + 4,
             orientation='vertical'
@@ -112,7 +180,7 @@ class SlideMenu(ModalView):
             text="+ New Save State",
             color=ACCENT,
             size_hint_y=None,
-            height=rh('button'),
+            height=rh(Size.BUTTON),
             font_size=rfs('button')
         )
         new_save_btn.bind(on_press=self._create_new_save_state)
@@ -122,103 +190,157 @@ class SlideMenu(ModalView):
         self.menu_container.add_widget(header)
         self.menu_container.add_widget(scroll)
         self.menu_container.add_widget(footer)
-        
-        self._update_save_states_list()
     
     def _update_save_states_list(self) -> None:
-        """Refresh the list of save states displayed in the menu."""
-        self.states_grid.clear_widgets()
+        """Refresh the list of save states displayed in the menu.
         
-        save_states = self.timer_screen._get_all_save_states()
+        Rows are kept between refreshes, including across opens since
+        TimerScreen reuses the menu: rows of deleted states are detached
+        into a pool, rows for new states are taken from the pool (or
+        built when it is empty) and inserted in place, and surviving rows
+        only get their metadata texts updated.
+        """
+        grid = self.states_grid
+        rows = self._row_widgets
+        entries = self.timer_screen._get_all_save_states_with_metadata()
+        save_states = [state_name for state_name, _ in entries]
         
         if not save_states:
             # Show empty state message
-            no_states_label = Label(
-                text="No save states yet.\nCreate one to get started!",
+            self._row_pool.extend(rows.values())
+            rows.clear()
+            self._btn_actions.clear()
+            grid.clear_widgets()
+            if self._empty_label is None:
+                self._empty_label = Label(
+                    text="No save states yet.\nCreate one to get started!",
+                    color=MUTED,
+                    font_size="14sp",
+                    halign="center"
+                )
+                self._empty_label.bind(size=size_to_text_size)
+            grid.add_widget(self._empty_label)
+            return
+        
+        for placeholder in (self._empty_label, self._loading_label):
+            if placeholder is not None and placeholder.parent is grid:
+                grid.remove_widget(placeholder)
+        
+        # Detach rows of states that no longer exist
+        current = set(save_states)
+        for state_name in [name for name in rows if name not in current]:
+            row = rows.pop(state_name)
+            for button in row.action_buttons:
+                del self._btn_actions[id(button)]
+            grid.remove_widget(row)
+            self._row_pool.append(row)
+        
+        # Insert new rows at their list position (GridLayout children are
+        # stored in reverse display order) and refresh the others
+        for index, (state_name, metadata) in enumerate(entries):
+            row = rows.get(state_name)
+            if row is None:
+                if self._row_pool:
+                    row = self._row_pool.pop()
+                    self._rebind_row(row, state_name, metadata)
+                else:
+                    row = self._create_save_state_row(state_name, metadata)
+                rows[state_name] = row
+                grid.add_widget(row, index=len(grid.children) - index)
+            else:
+                self._refresh_metadata_row(row, metadata)
+    
+    def _show_loading(self) -> None:
+        """Show a placeholder in the still-empty list while the menu slides in.
+        
+        Only the first open has an empty list: the menu is reused, and
+        after the first refresh it always holds rows or the empty message.
+        """
+        if self.states_grid.children:
+            return
+        
+        if self._loading_label is None:
+            self._loading_label = Label(
+                text="Loading…",
                 color=MUTED,
                 font_size="14sp",
                 halign="center"
             )
-            no_states_label.bind(size=no_states_label.setter('text_size'))
-            self.states_grid.add_widget(no_states_label)
-        else:
-            # Add a row for each save state
-            for state_name in save_states:
-                state_row = self._create_save_state_row(state_name)
-                self.states_grid.add_widget(state_row)
+            self._loading_label.bind(size=size_to_text_size)
+        self.states_grid.add_widget(self._loading_label)
     
-    def _create_save_state_row(self, state_name: str):
+    def _create_save_state_row(self, state_name: str, metadata: Optional[dict]):
         """Create a row displaying a save state with action buttons.
         
         Args:
             state_name: Name of the save state
+            metadata: Metadata of the save state, or None if unavailable
             
         Returns:
             BoxLayout widget containing the save state display
         """
+        # Sizes shared by the row's components
+        button_height = rh(Size.BUTTON)
+        padding = rp()
+        spacing = rs()
+        
         # Calculate row height based on components
-        row_height = rh('button') * 2 + rp() * 2 + rs()
+        row_height = button_height * 2 + padding * 2 + spacing
         
         row = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
             height=row_height,
-            padding=rp(),
-            spacing=rs() / 2
+            padding=padding,
+            spacing=spacing / 2
         )
         
-        # Background
-        with row.canvas.before:
-            Color(0.14, 0.14, 0.14, 1)
-            row.bg = Rectangle()
-        row.bind(
-            pos=lambda w, *_: setattr(w.bg, 'pos', w.pos),
-            size=lambda w, *_: setattr(w.bg, 'size', w.size)
-        )
+        # Background is drawn by the states grid (_RowBackgroundGrid)
         
         # Top row: Name and action buttons
-        top_row = BoxLayout(size_hint_y=None, height=rh('button') - rs(), spacing=rs())
+        top_row = BoxLayout(size_hint_y=None, height=button_height - spacing, spacing=spacing)
         
         name_label = Label(
             text=state_name,
             color=TEXT,
             font_size="16sp",
             bold=True,
+            size_hint_x=0.5,
             halign="left",
             valign="middle"
         )
-        name_label.bind(size=name_label.setter('text_size'))
-        
-        # Button widths
-        btn_width = rh('button') + rp()
+        name_label.bind(size=size_to_text_size)
+        row.name_label = name_label
         
+        # Widths are proportional so the top row lays out in one pass
         export_btn = RButton(
             text="Export",
             color=PRIMARY,
-            size_hint_x=None,
-            width=btn_width,
+            size_hint_x=0.17,
             font_size="13sp"
         )
-        export_btn.bind(on_press=lambda *_: self._export_save_state(state_name))
         
         load_btn = RButton(
             text="Load",
             color=ACCENT,
-            size_hint_x=None,
-            width=btn_width,
+            size_hint_x=0.17,
             font_size="13sp"
         )
-        load_btn.bind(on_press=lambda *_: self._load_save_state(state_name))
         
         delete_btn = RButton(
             text=ICON_TRASH,
             color=DANGER,
-            size_hint_x=None,
-            width=rh('button') - rs(),
+            size_hint_x=0.16,
             font_name=ICON_FONT,
             font_size="16sp"
         )
-        delete_btn.bind(on_press=lambda *_: self._delete_save_state(state_name))
+        track_icon_label(delete_btn)
+        
+        # All row buttons share one handler that looks up their action
+        row.action_buttons = (export_btn, load_btn, delete_btn)
+        for button in row.action_buttons:
+            button.bind(on_press=self._dispatch)
+        self._bind_row_actions(row, state_name)
         
         top_row.add_widget(name_label)
         top_row.add_widget(export_btn)
@@ -226,103 +348,105 @@ class SlideMenu(ModalView):
         top_row.add_widget(delete_btn)
         
         # Bottom row: Metadata display
-        bottom_row = self._create_metadata_row(state_name)
+        row.metadata_row = self._create_metadata_row(metadata)
         
         row.add_widget(top_row)
-        row.add_widget(bottom_row)
+        row.add_widget(row.metadata_row)
         
         return row
     
-    def _create_metadata_row(self, state_name: str):
-        """Create a row displaying save state metadata.
+    def _bind_row_actions(self, row, state_name: str) -> None:
+        """Point a row's buttons at a save state.
         
         Args:
-            state_name: Name of the save state
-            
-        Returns:
-            BoxLayout with time, lap count, and creation date
+            row: Row widget created by _create_save_state_row
+            state_name: Name of the save state the buttons act on
         """
-        bottom_row = BoxLayout(
-            size_hint_y=None,
-            height=rh('button') - rp(),
-            spacing=rs() + 4,
-            padding=[0, rs() / 2]
-        )
-        
-        metadata = self.timer_screen._get_save_state_metadata(state_name)
+        for button, action in zip(row.action_buttons, ('export', 'load', 'delete')):
+            self._btn_actions[id(button)] = (action, state_name)
+    
+    def _rebind_row(self, row, state_name: str, metadata: Optional[dict]) -> None:
+        """Reuse a pooled row widget for another save state.
         
-        if metadata:
-            from utils import format_time
-            
-            # Timer time
-            time_container = self._create_metadata_item(
-                ICON_CLOCK,
-                format_time(metadata['time']),
-                0.3
-            )
-            
-            # Lap count
-            laps_container = self._create_metadata_item(
-                ICON_FLAG_CHECKERED,
-                f"{metadata['lap_count']} laps",
-                0.25
-            )
-            
-            # Creation date
-            created_container = self._create_metadata_item(
-                ICON_CALENDAR,
-                metadata['created'],
-                0.35
-            )
-            
-            spacer = Widget(size_hint_x=0.1)
-            
-            bottom_row.add_widget(time_container)
-            bottom_row.add_widget(laps_container)
-            bottom_row.add_widget(spacer)
-            bottom_row.add_widget(created_container)
+        Args:
+            row: Detached row widget from the pool
+            state_name: Name of the save state to display
+            metadata: Metadata of the save state, or None if unavailable
+        """
+        row.name_label.text = state_name
+        self._bind_row_actions(row, state_name)
+        self._refresh_metadata_row(row, metadata)
+    
+    def _dispatch(self, button) -> None:
+        """Run the action of a save state row button.
         
-        return bottom_row
+        Args:
+            button: The pressed row button
+        """
+        action, state_name = self._btn_actions[id(button)]
+        if action == 'export':
+            self._export_save_state(state_name)
+        elif action == 'load':
+            self._load_save_state(state_name)
+        elif action == 'delete':
+            self._delete_save_state(state_name)
     
-    def _create_metadata_item(self, icon: str, text: str, 
-                             size_hint: float):
-        """Create a metadata display item with icon and text.
+    def _create_metadata_row(self, metadata: Optional[dict]):
+        """Create a row displaying save state metadata.
+        
+        The icons and values are drawn by a single markup Label instead
+        of a box of icon and text labels per value.
         
         Args:
-            icon: Font Awesome unicode character
-            text: Text to display
-            size_hint: Horizontal size hint
+            metadata: Metadata of the save state, or None if unavailable
             
         Returns:
-            BoxLayout containing icon and text labels
+            Label with time, lap count, and creation date (empty if no
+            metadata is available)
         """
-        container = BoxLayout(size_hint_x=size_hint, spacing=rs() / 2)
-        
-        icon_label = Label(
-            text=icon,
-            font_name=ICON_FONT,
-            color=MUTED,
-            font_size="12sp",
-            size_hint_x=None,
-            width=rp() * 1.5,
-            halign="center",
-            valign="middle"
-        )
-        icon_label.bind(size=icon_label.setter('text_size'))
-        
-        text_label = Label(
-            text=text,
+        metadata_label = Label(
+            text=self._metadata_markup(metadata),
+            markup=True,
             color=MUTED,
             font_size="12sp",
+            size_hint_y=None,
+            height=rh(Size.BUTTON) - rp(),
+            padding=[0, rs() / 2],
             halign="left",
             valign="middle"
         )
-        text_label.bind(size=text_label.setter('text_size'))
+        track_icon_label(metadata_label)
+        metadata_label.bind(size=size_to_text_size)
         
-        container.add_widget(icon_label)
-        container.add_widget(text_label)
+        return metadata_label
+    
+    def _metadata_markup(self, metadata: Optional[dict]) -> str:
+        """Format save state metadata as markup with inline icons.
         
-        return container
+        Args:
+            metadata: Metadata dict as returned by StateManager.get_save_metadata,
+                or None
+            
+        Returns:
+            Markup text for the metadata label
+        """
+        if not metadata:
+            return ""
+        
+        return (
+            f"[font={ICON_FONT}]{ICON_CLOCK}[/font] {_fmt_time(metadata['time'])}    "
+            f"[font={ICON_FONT}]{ICON_FLAG_CHECKERED}[/font] {metadata['lap_count']} laps    "
+            f"[font={ICON_FONT}]{ICON_CALENDAR}[/font] {metadata['created']}"
+        )
+    
+    def _refresh_metadata_row(self, row, metadata: Optional[dict]) -> None:
+        """Update the metadata text of an existing save state row.
+        
+        Args:
+            row: Row widget created by _create_save_state_row
+            metadata: Metadata of the save state, or None if unavailable
+        """
+        row.metadata_row.text = self._metadata_markup(metadata)
     
     def _create_new_save_state(self, *args) -> None:
         """Open dialog for creating a new save state."""
@@ -384,27 +508,62 @@ class SlideMenu(ModalView):
         """
         self.timer_screen._export_save_state_to_csv(state_name)
     
-    def open(self, *args) -> None:
-        """Open the menu with slide-in animation from left."""
-        super().open(*args)
-        self._update_save_states_list()
+    def _start_slide(self, x: float) -> Animation:
+        """Slide the menu to a horizontal position, replacing any running slide.
+        
+        Cancelling the previous animation keeps rapid open/close taps from
+        stacking animations whose completions would fire out of order.
+        
+        Args:
+            x: Target pos_hint x value
+            
+        Returns:
+            The started Animation
+        """
+        if self._anim is not None:
+            self._anim.cancel(self)
         
-        # Animate slide-in
         anim = Animation(
-            pos_hint={'x': 0, 'y': 0},
+            pos_hint={'x': x, 'y': 0},
             duration=0.3,
             t='out_cubic'
         )
+        self._anim = anim
         anim.start(self)
+        return anim
+    
+    def open(self, *args) -> None:
+        """Open the menu with slide-in animation from left.
+        
+        The menu content is built on the first open, and the save state
+        list is refreshed once the slide-in has finished so reading the
+        saves doesn't stall the animation. TimerScreen reuses the menu, so
+        later opens show the rows of the previous open until then.
+        """
+        if not self._built:
+            self._build_menu()
+            self._built = True
+        self._show_loading()
+        
+        super().open(*args)
+        
+        # Animate slide-in
+        anim = self._start_slide(0)
+        
+        def on_opened(*_):
+            if self._anim is anim:
+                self._anim = None
+                self._update_save_states_list()
+        
+        anim.bind(on_complete=on_opened)
     
     def dismiss(self, *args, **kwargs) -> None:
         """Close the menu with slide-out animation to left."""
-        anim = Animation(
-            pos_hint={'x': -0.75, 'y': 0},
-            duration=0.3,
-            t='out_cubic'
-        )
-        anim.bind(
-            on_complete=lambda *_: super(SlideMenu, self).dismiss(*args, **kwargs)
-        )
-        anim.start(self)
\ No newline at end of file
+        anim = self._start_slide(-0.75)
+        
+        def on_closed(*_):
+            if self._anim is anim:
+                self._anim = None
+                super(SlideMenu, self).dismiss(*args, **kwargs)
+        
+        anim.bind(on_complete=on_closed)
@@ -4,66 +4,141 @@ This module monkey-patches the Slider class to have larger touch areas
 on mobile platforms. Call apply_slider_patches() at app startup.
 """
 
+from functools import partial
+
+from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.uix.slider import Slider
 from kivy.utils import platform
 
 
+_IS_MOBILE = platform in ('android', 'ios')
+"""bool: Whether running on a mobile platform; fixed for the process lifetime."""
+
 # Store original methods
 _original_slider_init = Slider.__init__
-_original_slider_on_touch_down = Slider.on_touch_down
-_original_slider_on_touch_move = Slider.on_touch_move
+_original_slider_touch_up = Slider.on_touch_up
+
+
+_HIT_MARGIN = 30
+"""int: Pixels the touch area extends across the slider's track."""
+
+_RELEASE_DISTANCE = 200
+"""int: Pixels a dragging touch may leave the hit area before it is released."""
+
+
+def _update_hitbox(self, *args):
+    """Cache the expanded hit area and drag axis of a patched slider.
+    
+    Bound to pos, size and orientation, so the touch handlers only read
+    plain attributes. _axis is 0 for horizontal sliders and 1 for
+    vertical ones, indexing (width, height).
+    """
+    x, y = self.pos
+    width, height = self.size
+    if self.orientation == 'horizontal':
+        # Expand vertical touch area
+        self._axis = 0
+        self._hit_x_lo, self._hit_x_hi = x, x + width
+        self._hit_y_lo, self._hit_y_hi = y - _HIT_MARGIN, y + height + _HIT_MARGIN
+    else:
+        # Expand horizontal touch area
+        self._axis = 1
+        self._hit_x_lo, self._hit_x_hi = x - _HIT_MARGIN, x + width + _HIT_MARGIN
+        self._hit_y_lo, self._hit_y_hi = y, y + height
+
+
+def _apply_pending_pos(self, *args):
+    """Move a patched slider to the latest dragged position.
+    
+    Triggered at most once per frame by _patched_on_touch_move.
+    """
+    pos = self._pending_pos
+    if pos is not None:
+        self._pending_pos = None
+        self.value_pos = pos
 
 
 def _patched_slider_init(self, **kwargs):
     """Patched __init__ with larger touch areas for mobile."""
     _original_slider_init(self, **kwargs)
     
-    if platform in ('android', 'ios'):
-        # Much larger cursor for mobile
-        self.cursor_height = 48
-        self.cursor_width = 48
-        self.padding = 16
+    # Patches are only installed on mobile (see apply_slider_patches)
+    # Much larger cursor for mobile
+    self.cursor_height = 48
+    self.cursor_width = 48
+    self.padding = 16
+    
+    # Latest dragged position, applied on the next frame
+    self._pending_pos = None
+    self._flush_trigger = Clock.create_trigger(partial(_apply_pending_pos, self))
+    
+    _update_hitbox(self)
+    self.fbind('pos', _update_hitbox)
+    self.fbind('size', _update_hitbox)
+    self.fbind('orientation', _update_hitbox)
     
 
 def _patched_on_touch_down(self, touch):
-    """Patched touch down with expanded hit area."""
-    # Expand touch detection area for mobile
-    if platform in ('android', 'ios'):
-        if self.orientation == 'horizontal':
-            # Expand vertical touch area by 30px
-            if (self.x <= touch.x <= self.right and 
-                self.y - 30 <= touch.y <= self.top + 30):
-                # Force it to register as a hit
-                touch.grab(self)
-                if self.width > 0:
-                    self.value_pos = touch.x
-                return True
-        else:
-            # Expand horizontal touch area by 30px
-            if (self.y <= touch.y <= self.top and
-                self.x - 30 <= touch.x <= self.right + 30):
-                touch.grab(self)
-                if self.height > 0:
-                    self.value_pos = touch.y
-                return True
+    """Patched touch down with expanded hit area.
+    
+    Only installed on mobile, so no platform check is needed here. The
+    expanded area contains the whole slider, so a touch outside of it
+    could never hit the original handler either; it is rejected here
+    without calling back into Slider.on_touch_down.
+    """
+    if self.disabled:
+        return False
     
-    # Fall back to original behavior
-    return _original_slider_on_touch_down(self, touch)
+    # Expanded hit area, precomputed by _update_hitbox
+    tx, ty = touch.x, touch.y
+    if (self._hit_x_lo <= tx <= self._hit_x_hi and
+            self._hit_y_lo <= ty <= self._hit_y_hi):
+        # Force it to register as a hit
+        touch.grab(self)
+        if self.size[self._axis] > 0:
+            # value_pos takes an (x, y) pair and reads the slider's axis
+            self.value_pos = touch.pos
+        return True
+    
+    return False
 
 
 def _patched_on_touch_move(self, touch):
-    """Patched touch move to work with grabbed touches."""
+    """Patched touch move to work with grabbed touches.
+    
+    High-rate touch panels report moves faster than the screen
+    refreshes, so only the latest position is kept and applied on the
+    next frame. A touch that wanders far away from the slider is
+    released, so the slider stops receiving its remaining move events.
+    """
     if touch.grab_current is self:
-        # We grabbed this touch, update value
-        if self.orientation == 'horizontal':
-            if self.width > 0:
-                self.value_pos = touch.x
-        else:
-            if self.height > 0:
-                self.value_pos = touch.y
+        # We grabbed this touch, update value on the next frame
+        tx, ty = touch.pos
+        if self.size[self._axis] > 0:
+            self._pending_pos = touch.pos
+            self._flush_trigger()
+        
+        if not (self._hit_x_lo - _RELEASE_DISTANCE <= tx <= self._hit_x_hi + _RELEASE_DISTANCE and
+                self._hit_y_lo - _RELEASE_DISTANCE <= ty <= self._hit_y_hi + _RELEASE_DISTANCE):
+            touch.ungrab(self)
+            return False
         return True
     
-    return _original_slider_on_touch_move(self, touch)
+    # Slider only handles moves of touches it grabbed
+    return False
+
+
+def _patched_on_touch_up(self, touch):
+    """Patched touch up that drops a still pending dragged position.
+    
+    Slider.on_touch_up sets the final position itself, which a later
+    flush of an older position must not overwrite.
+    """
+    if touch.grab_current is self:
+        self._flush_trigger.cancel()
+        self._pending_pos = None
+    return _original_slider_touch_up(self, touch)
 
 
 def apply_slider_patches():
@@ -79,11 +154,12 @@ def apply_slider_patches():
                 apply_slider_patches()  # Apply patches first
                 return build_ui()
     """
-    if platform in ('android', 'ios'):
-        print("🔧 Applying mobile slider patches...")
+    if _IS_MOBILE:
+        Logger.info('SliderPatch: Applying mobile slider patches')
         Slider.__init__ = _patched_slider_init
         Slider.on_touch_down = _patched_on_touch_down
         Slider.on_touch_move = _patched_on_touch_move
-        print("✅ Slider patches applied")
+        Slider.on_touch_up = _patched_on_touch_up
+        Logger.info('SliderPatch: Slider patches applied')
     else:
-        print("ℹ️ Desktop platform - slider patches not needed")
\ No newline at end of file
+        Logger.info('SliderPatch: Desktop platform - slider patches not needed')
\ No newline at end of file
@@ -4,16 +4,145 @@ This module provides a custom spinner/dropdown widget for selecting
 labels with visual color indicators.
 """
 
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.dropdown import DropDown
-from kivy.graphics import Color, Rectangle, Ellipse
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
 
 from constants import SURFACE_LIGHT, TEXT
-from utils import rh, rp, rs
+from utils import Size, rh, rp, rs, size_to_text_size
+
+
+_CIRCLE_TEXTURE_SIZE = 64
+"""int: Edge length in pixels of the pre-rendered dot texture."""
+
+_circle_texture = None
+"""Optional[Texture]: White anti-aliased circle, tinted by each dot's Color."""
+
+
+def _blit_circle(texture: Texture) -> None:
+    """Draw a white anti-aliased circle into the dot texture.
+    
+    Also registered as the texture's reload observer, since its GL
+    contents are lost when the context is (e.g. on Android pause).
+    
+    Args:
+        texture: Texture of _CIRCLE_TEXTURE_SIZE pixels per side
+    """
+    size = _CIRCLE_TEXTURE_SIZE
+    radius = size / 2
+    buf = bytearray(size * size * 4)
+    i = 0
+    for y in range(size):
+        dy = y + 0.5 - radius
+        for x in range(size):
+            dx = x + 0.5 - radius
+            # Fade out over the pixel straddling the edge
+            coverage = radius - (dx * dx + dy * dy) ** 0.5
+            alpha = 0 if coverage <= 0 else 255 if coverage >= 1 else int(coverage * 255)
+            buf[i:i + 4] = (255, 255, 255, alpha)
+            i += 4
+    texture.blit_buffer(bytes(buf), colorfmt='rgba', bufferfmt='ubyte')
+
+
+def _get_circle_texture() -> Texture:
+    """Return the texture drawn for every color dot.
+    
+    Rendered once on first use, so each dot is a single textured
+    rectangle instead of a tessellated circle.
+    
+    Returns:
+        RGBA texture of a white circle on a transparent background
+    """
+    global _circle_texture
+    if _circle_texture is None:
+        size = _CIRCLE_TEXTURE_SIZE
+        _circle_texture = Texture.create(size=(size, size), colorfmt='rgba')
+        _blit_circle(_circle_texture)
+        _circle_texture.add_reload_observer(_blit_circle)
+    return _circle_texture
+
+
+def _sync_bg(widget, *args) -> None:
+    """Keep a widget's bg_rect aligned with the widget.
+    
+    Shared by the spinner and its dropdown container instead of a pair
+    of callbacks per widget.
+    """
+    rect = widget.bg_rect
+    rect.pos = widget.pos
+    rect.size = widget.size
+
+
+def _sync_dot_pos(widget, *args) -> None:
+    """Center a dot widget's dot_rect within the widget."""
+    rect = widget.dot_rect
+    dot_width, dot_height = rect.size
+    rect.pos = (
+        widget.x + widget.width / 2 - dot_width / 2,
+        widget.y + widget.height / 2 - dot_height / 2
+    )
+
+
+def _create_dot() -> Widget:
+    """Create a color dot widget with its dot_color and dot_rect.
+    
+    Returns:
+        Widget drawing the circle texture, tinted by dot_color
+    """
+    dot = Widget(size_hint_x=None)
+    with dot.canvas:
+        dot.dot_color = Color()
+        dot.dot_rect = Rectangle(texture=_get_circle_texture())
+    dot.fbind('pos', _sync_dot_pos)
+    dot.fbind('size', _sync_dot_pos)
+    return dot
+
+
+def _show_label(box, dot: Widget, name_label: Label, label: dict) -> None:
+    """Show a label's name and color dot in a row, updating it in place.
+    
+    The dot is only added or removed when switching to or from the
+    default label.
+    
+    Args:
+        box: Row containing the name label, the dot goes in front of it
+        dot: Dot widget created by _create_dot
+        name_label: Label showing the name
+        label: Label dictionary with 'name', 'color', and 'is_default' keys
+    """
+    # Add color dot for non-default labels
+    if label["is_default"]:
+        if dot.parent is not None:
+            box.remove_widget(dot)
+    else:
+        padding = rp()
+        dot_size = padding * 1.5
+        dot.width = padding * 2.5
+        dot.dot_rect.size = (dot_size, dot_size)
+        dot.dot_color.rgba = label["color"]
+        _sync_dot_pos(dot)
+        if dot.parent is None:
+            # Children are stored in reverse order: index 1 puts the
+            # dot in front of the name label
+            box.add_widget(dot, index=1)
+    
+    name_label.text = label["name"]
+
+
+class _OptionButton(ButtonBehavior, BoxLayout):
+    """Combined ButtonBehavior and BoxLayout for dropdown options.
+    
+    Attributes:
+        label: Label dictionary the option currently stands for
+        dot: Color dot shown for non-default labels
+        name_label: Label showing the option's name
+    """
+    pass
 
 
 class LabelSpinner(ButtonBehavior, BoxLayout):
@@ -28,6 +157,9 @@ class LabelSpinner(ButtonBehavior, BoxLayout):
         lm: LabelManager instance for accessing label data
         on_change: Optional callback function called when label changes
         dropdown: DropDown widget instance
+        _dot_widget: Color dot shown for non-default labels
+        _name_label: Label showing the selected label's name
+        _option_pool: Option buttons kept across dropdown rebuilds
     """
     
     def __init__(self, lap: dict, label_manager, 
@@ -48,151 +180,143 @@ class LabelSpinner(ButtonBehavior, BoxLayout):
         self.spacing = rs()
         self.padding = [rp(), 0]
         self.size_hint_y = None
-        self.height = kwargs.get('height', rh('button'))
+        self.height = kwargs.get('height', rh(Size.BUTTON))
         
         # Draw background
         with self.canvas.before:
             Color(*SURFACE_LIGHT)
             self.bg_rect = Rectangle()
-        self.bind(pos=self._update_bg, size=self._update_bg)
+        self.fbind('pos', _sync_bg)
+        self.fbind('size', _sync_bg)
         
         self.lap = lap
         self.lm = label_manager
         self.on_change = on_change
         
-        # Create dropdown menu
+        # Create dropdown menu; its options are built on first open
         self.dropdown = DropDown()
-        self._populate_dropdown()
+        self._labels_version = None
+        self._option_pool: List[_OptionButton] = []
+        
+        # Options are stacked without gaps, so one rectangle behind the
+        # dropdown's container is the background of all option buttons
+        container = self.dropdown.container
+        with container.canvas.before:
+            Color(*SURFACE_LIGHT)
+            container.bg_rect = Rectangle()
+        container.fbind('pos', _sync_bg)
+        container.fbind('size', _sync_bg)
+        
+        self.fbind('on_release', self._on_release)
+        self.dropdown.fbind('on_select', self._on_dropdown_select)
         
-        self.bind(on_release=self._on_release)
-        self.dropdown.bind(on_select=lambda instance, data: self._select_label(data))
+        # Display widgets are created once and updated in place
+        self._dot_widget = _create_dot()
+        
+        self._name_label = Label(color=TEXT, halign="left", valign="center")
+        self._name_label.fbind('size', size_to_text_size)
+        self.add_widget(self._name_label)
         
         self._update_display()
     
     def _on_release(self, *args) -> None:
-        """Handle button click by refreshing and opening dropdown."""
-        self._populate_dropdown()
+        """Handle button click by opening the dropdown.
+        
+        The options are built on the first open and only rebuilt if the
+        labels changed since they were last populated.
+        """
+        version = self.lm.version
+        if version != self._labels_version:
+            self._populate_dropdown()
+            self._labels_version = version
         self.dropdown.open(self)
     
-    def _update_bg(self, *args) -> None:
-        """Update background rectangle position and size."""
-        self.bg_rect.pos = self.pos
-        self.bg_rect.size = self.size
+    def _on_option_release(self, button: _OptionButton) -> None:
+        """Select the label of a released option button.
+        
+        Args:
+            button: The released option button
+        """
+        self.dropdown.select(button.label)
+    
+    def _on_dropdown_select(self, dropdown, label_data: dict) -> None:
+        """Forward a dropdown selection to _select_label."""
+        self._select_label(label_data)
 
     def _populate_dropdown(self) -> None:
         """Populate dropdown menu with current label options.
         
-        Clears existing options and rebuilds the dropdown with all
-        labels from the current group.
+        Option buttons are pooled: existing ones are updated in place
+        for the labels of the current group, new ones are only created
+        when there are more labels than pooled buttons, and surplus
+        buttons are detached but kept for later rebuilds.
         """
-        self.dropdown.clear_widgets()
-        for label in self.lm.all():
-            btn = self._create_option_button(label)
-            btn.bind(on_release=lambda btn, lbl=label: self.dropdown.select(lbl))
-            self.dropdown.add_widget(btn)
+        labels = self.lm.all()
+        pool = self._option_pool
+        while len(pool) < len(labels):
+            pool.append(self._create_option_button())
+        
+        padding, spacing, button_height = rp(), rs(), rh(Size.BUTTON)
+        for btn, label in zip(pool, labels):
+            # Sizes may have changed with the window since the last rebuild
+            btn.spacing = spacing
+            btn.padding = [padding, 0]
+            btn.height = button_height
+            btn.label = label
+            _show_label(btn, btn.dot, btn.name_label, label)
+            if btn.parent is None:
+                # Detached buttons are always at the end of the pool
+                self.dropdown.add_widget(btn)
+        
+        for btn in pool[len(labels):]:
+            if btn.parent is not None:
+                self.dropdown.remove_widget(btn)
 
-    def _create_option_button(self, label: dict):
+    def _create_option_button(self) -> _OptionButton:
         """Create a button widget for a dropdown option.
         
-        Args:
-            label: Label dictionary with 'name', 'color', and 'is_default' keys
-            
+        The button is empty until _populate_dropdown assigns it a label.
+        
         Returns:
             ButtonBehavior + BoxLayout widget configured as an option button
         """
-        class OptionButton(ButtonBehavior, BoxLayout):
-            """Combined ButtonBehavior and BoxLayout for dropdown options."""
-            pass
-        
-        btn = OptionButton(
-            spacing=rs(),
-            padding=[rp(), 0],
-            size_hint_y=None,
-            height=rh('button')
-        )
-        
-        # Draw button background
-        with btn.canvas.before:
-            Color(*SURFACE_LIGHT)
-            btn.bg_rect = Rectangle()
-        btn.bind(
-            pos=lambda w, *_: setattr(w.bg_rect, 'pos', w.pos),
-            size=lambda w, *_: setattr(w.bg_rect, 'size', w.size)
-        )
-        
-        # Add color dot for non-default labels
-        if not label["is_default"]:
-            dot_size = rp() * 1.5
-            dot = Widget(size_hint_x=None, width=rp() * 2.5)
-            with dot.canvas:
-                Color(*label["color"])
-                dot_circle = Ellipse(size=(dot_size, dot_size))
-            
-            def update_dot_pos(widget, *args):
-                dot_circle.pos = (
-                    widget.x + widget.width / 2 - dot_size / 2, 
-                    widget.y + widget.height / 2 - dot_size / 2
-                )
-            
-            dot.bind(pos=update_dot_pos, size=update_dot_pos)
-            btn.add_widget(dot)
+        btn = _OptionButton(size_hint_y=None)
+        btn.label = None
+        btn.dot = _create_dot()
         
         # Add label name
-        name_label = Label(
-            text=label["name"], 
+        btn.name_label = Label(
             color=TEXT, 
             halign="left",
             valign="center"
         )
-        name_label.bind(size=name_label.setter('text_size'))
-        btn.add_widget(name_label)
+        btn.name_label.fbind('size', size_to_text_size)
+        btn.add_widget(btn.name_label)
         
+        btn.fbind('on_release', self._on_option_release)
         return btn
 
     def _update_display(self) -> None:
-        """Update the spinner's display with currently selected label.
-        
-        Clears and rebuilds the spinner's content to show the color
-        dot and name of the currently selected label.
-        """
-        self.clear_widgets()
-        
-        # Add color dot for non-default labels
-        if not self.lap["lbl"]["is_default"]:
-            dot_size = rp() * 1.5
-            dot = Widget(size_hint_x=None, width=rp() * 2.5)
-            with dot.canvas:
-                Color(*self.lap["lbl"]["color"])
-                display_circle = Ellipse(size=(dot_size, dot_size))
-            
-            def update_display_dot_pos(widget, *args):
-                display_circle.pos = (
-                    widget.x + widget.width / 2 - dot_size / 2, 
-                    widget.y + widget.height / 2 - dot_size / 2
-                )
-            
-            dot.bind(pos=update_display_dot_pos, size=update_display_dot_pos)
-            self.add_widget(dot)
-        
-        # Add label name
-        text_label = Label(
-            text=self.lap["lbl"]["name"], 
-            color=TEXT, 
-            halign="left",
-            valign="center"
-        )
-        text_label.bind(size=text_label.setter('text_size'))
-        self.add_widget(text_label)
+        """Update the spinner's display with currently selected label."""
+        _show_label(self, self._dot_widget, self._name_label, self.lap["lbl"])
 
     def _select_label(self, label_data: dict) -> None:
         """Handle label selection from dropdown.
         
         Updates the lap's label and triggers the on_change callback
-        if provided.
+        if provided. The lap keeps its own copy, since LabelManager edits
+        its label dictionaries in place; re-selecting the label the lap
+        already holds is ignored, so it costs neither the copy nor the
+        callback's refresh and save.
         
         Args:
             label_data: Selected label dictionary
         """
+        current = self.lap["lbl"]
+        # The lap's copy may carry extra keys such as 'group'
+        if all(current.get(key) == value for key, value in label_data.items()):
+            return
+        
         self.lap["lbl"] = label_data.copy()
         self._update_display()
         